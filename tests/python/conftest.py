@@ -229,11 +229,31 @@ _DEFAULT_CONTROL_RESPONSES: dict[str, dict] = {
 }
 
 
+_CONTROL_RECV_SIZE = 4096
+
+
 class _MockControlHandler(socketserver.StreamRequestHandler):
     """Handles one control channel client connection."""
 
+    def _iter_lines(self):
+        """Yield newline-delimited frames, reading in bulk chunks.
+
+        One recv() may carry several pipelined commands; any trailing
+        partial frame is kept in the residual buffer for the next read.
+        """
+        buf = b""
+        while True:
+            chunk = self.request.recv(_CONTROL_RECV_SIZE)
+            if not chunk:
+                break
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            yield from lines
+        if buf:
+            yield buf
+
     def handle(self) -> None:
-        for raw_line in self.rfile:
+        for raw_line in self._iter_lines():
             line = raw_line.decode().strip()
             if not line:
                 continue
@@ -474,6 +494,13 @@ def game_mechanic_entries() -> list[TelemetryEntry]:
 # --- Mock game server (for mock client tests) ---
 
 
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed, like spawn-clients does."""
+    from wowsim.event_loop import fast_loop_factory
+
+    return {"default": fast_loop_factory()}
+
+
 class _MockGameHandler(socketserver.StreamRequestHandler):
     """Accepts connections and discards data (mirrors C++ server behavior)."""
 
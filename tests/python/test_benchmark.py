@@ -113,7 +113,7 @@ class TestBenchmarkModelsJsonRoundTrip:
 
 
 # ============================================================
-# Group B: Percentile Computation (3 tests)
+# Group B: Percentile Computation (5 tests)
 # ============================================================
 
 
@@ -179,6 +179,24 @@ class TestPercentilesNoTicks:
         assert result is None
 
 
+class TestExtractTickMetrics:
+    """extract_tick_metrics fuses tick health and percentiles into one scan."""
+
+    def test_matches_separate_computations(self) -> None:
+        from wowsim.benchmark import compute_percentiles, extract_tick_metrics
+        from wowsim.health_check import compute_tick_health
+
+        entries = _make_tick_entries([3.0, 60.0, 4.5, 2.0, 7.25])
+        tick_health, percentiles = extract_tick_metrics(entries)
+        assert tick_health == compute_tick_health(entries)
+        assert percentiles == compute_percentiles(entries)
+
+    def test_no_ticks(self) -> None:
+        from wowsim.benchmark import extract_tick_metrics
+
+        assert extract_tick_metrics([]) == (None, None)
+
+
 # ============================================================
 # Group C: Throughput Computation (2 tests)
 # ============================================================
@@ -444,7 +462,7 @@ class TestFormatBenchmarkResult:
 
 
 # ============================================================
-# Group G: Orchestration with monkeypatch (3 tests)
+# Group G: Orchestration with monkeypatch (4 tests)
 # ============================================================
 
 
@@ -473,7 +491,7 @@ class TestOrchestratorHappyPath:
         )
 
         monkeypatch.setattr(benchmark, "_spawn_clients", lambda _cfg, _n: spawn)
-        monkeypatch.setattr(benchmark, "_read_telemetry", lambda _cfg: entries)
+        monkeypatch.setattr(benchmark, "_read_telemetry", lambda _tail: entries)
         monkeypatch.setattr(benchmark, "_settle", lambda _s: None)
 
         config = BenchmarkConfig(
@@ -506,7 +524,7 @@ class TestOrchestratorFailAt100:
 
         call_count = {"n": 0}
 
-        def mock_read(_cfg):
+        def mock_read(_tail):
             call_count["n"] += 1
             if call_count["n"] <= 2:
                 return good_entries
@@ -540,7 +558,7 @@ class TestOrchestratorBaselineSkipsSpawn:
             spawn_called["count"] += 1
 
         monkeypatch.setattr(benchmark, "_spawn_clients", mock_spawn)
-        monkeypatch.setattr(benchmark, "_read_telemetry", lambda _cfg: entries)
+        monkeypatch.setattr(benchmark, "_read_telemetry", lambda _tail: entries)
         monkeypatch.setattr(benchmark, "_settle", lambda _s: None)
 
         config = BenchmarkConfig(
@@ -553,8 +571,37 @@ class TestOrchestratorBaselineSkipsSpawn:
         assert len(result.scenarios) == 1
 
 
+class TestOrchestratorReusesUnchangedTelemetry:
+    """run_benchmark skips re-analysis when the telemetry view is unchanged."""
+
+    def test_reuse(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from wowsim import benchmark
+        from wowsim.models import BenchmarkConfig
+
+        entries = _make_tick_entries_for_health(200, 3.5)
+        analyzed = {"count": 0}
+        real_extract = benchmark.extract_tick_metrics
+
+        def counting_extract(telemetry):
+            analyzed["count"] += 1
+            return real_extract(telemetry)
+
+        monkeypatch.setattr(benchmark, "extract_tick_metrics", counting_extract)
+        monkeypatch.setattr(benchmark, "_read_telemetry", lambda _tail: entries)
+        monkeypatch.setattr(benchmark, "_settle", lambda _s: None)
+
+        config = BenchmarkConfig(
+            client_counts=[0, 0],
+            duration_seconds=1.0,
+            settle_seconds=0.0,
+        )
+        result = benchmark.run_benchmark(config)
+        assert analyzed["count"] == 1
+        assert result.scenarios[0].percentiles == result.scenarios[1].percentiles
+
+
 # ============================================================
-# Group H: CLI Integration (2 tests)
+# Group H: CLI Integration (3 tests)
 # ============================================================
 
 
@@ -586,3 +633,113 @@ class TestCLIBenchmarkMissingLogFile:
         runner = CliRunner()
         result = runner.invoke(main, ["benchmark"])
         assert result.exit_code != 0
+
+
+class TestCLIBenchmarkBadCounts:
+    """benchmark rejects a malformed --counts list before running anything."""
+
+    def test_bad_counts(self, sample_log_file) -> None:
+        from click.testing import CliRunner
+        from wowsim.cli import main
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["benchmark", "--log-file", str(sample_log_file), "--counts", "0,x"]
+        )
+        assert result.exit_code == 2
+        assert "--counts" in result.output
+
+
+# ============================================================
+# Group I: Incremental Telemetry Reads (5 tests)
+# ============================================================
+
+
+class TestReadTelemetryTail:
+    """_read_telemetry decodes only the lines appended since the last poll."""
+
+    def _write_ticks(self, path, durations: list[float], mode: str = "a") -> None:
+        with open(path, mode) as f:
+            for i, d in enumerate(durations):
+                line = _make_line(
+                    "metric",
+                    "game_loop",
+                    "Tick completed",
+                    {"tick": i + 1, "duration_ms": d, "overrun": False},
+                )
+                f.write(line + "\n")
+
+    def _tail(self, log):
+        from wowsim import benchmark
+
+        return benchmark._TelemetryTail(log)
+
+    def test_decodes_only_new_lines(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from wowsim import benchmark
+
+        log = tmp_path / "telemetry.jsonl"
+        self._write_ticks(log, [3.0, 4.0])
+        tail = self._tail(log)
+        decoded: list[int] = []
+        real_parse = benchmark.parse_records
+
+        def counting_parse(lines):
+            records = real_parse(lines)
+            decoded.append(len(records))
+            return records
+
+        monkeypatch.setattr(benchmark, "parse_records", counting_parse)
+
+        first = benchmark._read_telemetry(tail)
+        assert benchmark._read_telemetry(tail) is first
+        self._write_ticks(log, [5.0])
+        cols = benchmark._read_telemetry(tail)
+        assert cols.tick_durations == [3.0, 4.0, 5.0]
+        assert decoded == [2, 1]
+
+    def test_partial_line_waits_for_newline(self, tmp_path) -> None:
+        from wowsim import benchmark
+
+        log = tmp_path / "telemetry.jsonl"
+        self._write_ticks(log, [3.0])
+        tail = self._tail(log)
+        line = _make_line("metric", "game_loop", "Tick completed", {"duration_ms": 7.0})
+        with open(log, "a") as f:
+            f.write(line[:20])
+        assert benchmark._read_telemetry(tail).tick_durations == [3.0]
+        with open(log, "a") as f:
+            f.write(line[20:] + "\n")
+        assert benchmark._read_telemetry(tail).tick_durations == [3.0, 7.0]
+
+    def test_window_keeps_last_max_lines(self, tmp_path) -> None:
+        from wowsim import benchmark
+
+        log = tmp_path / "telemetry.jsonl"
+        self._write_ticks(log, [float(i) for i in range(2005)])
+        tail = self._tail(log)
+        durations = benchmark._read_telemetry(tail).tick_durations
+        assert len(durations) == 2000
+        assert durations[0] == 5.0
+
+    def test_truncated_log_reread(self, tmp_path) -> None:
+        from wowsim import benchmark
+
+        log = tmp_path / "telemetry.jsonl"
+        self._write_ticks(log, [3.0, 4.0])
+        tail = self._tail(log)
+        assert len(benchmark._read_telemetry(tail).tick_durations) == 2
+        self._write_ticks(log, [9.0], mode="w")
+        assert benchmark._read_telemetry(tail).tick_durations == [9.0]
+
+    def test_rewritten_log_reread(self, tmp_path) -> None:
+        from wowsim import benchmark
+
+        log = tmp_path / "telemetry.jsonl"
+        self._write_ticks(log, [3.0, 4.0])
+        tail = self._tail(log)
+        assert benchmark._read_telemetry(tail).tick_durations == [3.0, 4.0]
+        # Same inode, and the new contents run past the old offset.
+        self._write_ticks(log, [10.0, 11.0, 12.0], mode="w")
+        assert benchmark._read_telemetry(tail).tick_durations == [10.0, 11.0, 12.0]
@@ -81,6 +81,22 @@ class TestControlResponseParsesError:
         assert resp.fault_id is None
 
 
+class TestFaultInfoClosedSetFields:
+    """FaultInfo interns fault IDs and restricts mode to known values."""
+
+    def test_ids_interned(self) -> None:
+        raw = '{"id":"latency-spike","mode":"tick_scoped","active":false}'
+        a = FaultInfo.model_validate_json(raw)
+        b = FaultInfo.model_validate_json(raw)
+        assert a.id is b.id
+
+    def test_unknown_mode_rejected(self) -> None:
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            FaultInfo(id="latency-spike", mode="sometimes", active=False)
+
+
 # ---------------------------------------------------------------------------
 # Group B: Duration parsing
 # ---------------------------------------------------------------------------
@@ -129,6 +145,16 @@ class TestParseDurationTicksAndInvalid:
         with pytest.raises(ValueError):
             parse_duration("")
 
+    def test_fractional_ticks_and_negative_raise(self) -> None:
+        with pytest.raises(ValueError, match="integer before 't'"):
+            parse_duration("1.5t")
+        with pytest.raises(ValueError):
+            parse_duration("-5s")
+        with pytest.raises(ValueError):
+            parse_duration("1e3s")
+        with pytest.raises(ValueError):
+            parse_duration("5s\n")
+
 
 # ---------------------------------------------------------------------------
 # Group C: Client commands via sync wrappers
@@ -203,9 +229,43 @@ class TestListReturnsFaultList:
         assert resp.success is True
         assert resp.faults is not None
         assert len(resp.faults) == 4
-        fault_ids = [f.id for f in resp.faults]
-        assert "latency-spike" in fault_ids
-        assert "memory-pressure" in fault_ids
+        fault_ids = {f.id for f in resp.faults}
+        assert {"latency-spike", "memory-pressure"} <= fault_ids
+
+
+class TestSyncWrappersReuseEventLoop:
+    """Sync wrappers share one event loop across calls and threads."""
+
+    def test_same_loop_across_calls(self, mock_control_server: dict) -> None:
+        from wowsim.fault_trigger import _get_runner
+
+        host = mock_control_server["host"]
+        port = mock_control_server["port"]
+        list_all_faults(host, port)
+        loop = _get_runner().get_loop()
+        deactivate_all_faults(host, port)
+        assert _get_runner().get_loop() is loop
+        assert not loop.is_closed()
+
+    def test_same_loop_across_threads(self, mock_control_server: dict) -> None:
+        import threading
+
+        from wowsim.fault_trigger import _get_runner
+
+        host = mock_control_server["host"]
+        port = mock_control_server["port"]
+        list_all_faults(host, port)
+        loop = _get_runner().get_loop()
+        threads = [
+            threading.Thread(target=list_all_faults, args=(host, port))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert _get_runner().get_loop() is loop
+        assert len(mock_control_server["received"]) == 9
 
 
 # ---------------------------------------------------------------------------
@@ -235,6 +295,21 @@ class TestConnectionRefusedRaises:
             activate_fault("127.0.0.1", 1, "latency-spike")
 
 
+class TestUnresponsiveServerTimesOut:
+    """A server that accepts but never replies fails the command, not the loop."""
+
+    def test_no_reply_raises(self, monkeypatch) -> None:
+        import socket
+
+        import wowsim.fault_trigger as fault_trigger
+
+        monkeypatch.setattr(fault_trigger, "COMMAND_TIMEOUT_SEC", 0.2)
+        with socket.create_server(("127.0.0.1", 0)) as silent:
+            port = silent.getsockname()[1]
+            with pytest.raises(ControlClientError, match="No response"):
+                list_all_faults("127.0.0.1", port)
+
+
 class TestNotConnectedRaises:
     """Calling a command before connect() raises ControlClientError."""
 
@@ -293,8 +368,8 @@ class TestCLIListShowsFaults:
             cli_main, ["inject-fault", "--port", str(port), "list"]
         )
         assert result.exit_code == 0, result.output
-        assert "latency-spike" in result.output
-        assert "memory-pressure" in result.output
+        ids_in_output = set(result.output.split())
+        assert {"latency-spike", "memory-pressure"} <= ids_in_output
 
 
 class TestCLIConnectionRefusedError:
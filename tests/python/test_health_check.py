@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from wowsim.models import (
     Anomaly,
@@ -40,6 +41,18 @@ class TestTickHealthConstruction:
         assert tick.overrun_count == 2
         assert tick.overrun_pct == 2.0
 
+    def test_frozen(self) -> None:
+        tick = TickHealth(
+            total_ticks=1,
+            avg_duration_ms=3.5,
+            max_duration_ms=3.5,
+            min_duration_ms=3.5,
+            overrun_count=0,
+            overrun_pct=0.0,
+        )
+        with pytest.raises(ValidationError):
+            tick.total_ticks = 2
+
 
 class TestZoneHealthSummaryConstruction:
     """ZoneHealthSummary has all fields populated."""
@@ -58,6 +71,16 @@ class TestZoneHealthSummaryConstruction:
         assert zone.error_count == 0
         assert zone.avg_tick_duration_ms == 3.2
 
+    def test_state_is_closed_set(self) -> None:
+        with pytest.raises(ValidationError):
+            ZoneHealthSummary(
+                zone_id=1,
+                state="MELTING",
+                tick_count=0,
+                error_count=0,
+                avg_tick_duration_ms=0.0,
+            )
+
 
 class TestHealthReportJsonRoundTrip:
     """HealthReport model_dump_json → model_validate_json preserves data."""
@@ -175,10 +198,14 @@ class TestComputeTickHealthNoTicks:
 
 
 # ============================================================
-# Group C: Zone Health & Player Count (3 tests)
+# Group C: Zone Health & Player Count (4 tests)
 # ============================================================
 
-from wowsim.health_check import compute_zone_health, estimate_player_count
+from wowsim.health_check import (
+    compute_all_health,
+    compute_zone_health,
+    estimate_player_count,
+)
 
 
 class TestComputeZoneHealthMultipleZones:
@@ -219,6 +246,18 @@ class TestEstimatePlayerCount:
         assert count == 1
 
 
+class TestComputeAllHealth:
+    """Fused single pass matches the separate tick/zone/player computations."""
+
+    def test_matches_separate_passes(
+        self, health_log_entries: list[TelemetryEntry]
+    ) -> None:
+        tick, zones, players = compute_all_health(health_log_entries)
+        assert tick == compute_tick_health(health_log_entries)
+        assert zones == compute_zone_health(health_log_entries)
+        assert players == estimate_player_count(health_log_entries)
+
+
 # ============================================================
 # Group D: Status Determination (3 tests)
 # ============================================================
@@ -526,7 +565,7 @@ class TestCheckServerReachableFailure:
 
 
 # ============================================================
-# Group F: Report Building & Formatting (2 tests)
+# Group F: Report Building & Formatting (3 tests)
 # ============================================================
 
 from wowsim.health_check import build_health_report, format_health_report
@@ -553,6 +592,33 @@ class TestBuildHealthReportFromLog:
         assert report.error_count >= 1
         assert report.status in ("healthy", "degraded", "critical")
 
+    def test_unchanged_log_analyzed_once(
+        self, health_log_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from wowsim import health_check
+
+        reads = {"n": 0}
+        real_read = health_check.read_recent_entries
+
+        def counting_read(path: Path, max_lines: int = 500) -> list:
+            reads["n"] += 1
+            return real_read(path, max_lines)
+
+        monkeypatch.setattr(health_check, "read_recent_entries", counting_read)
+        health_check._analyze_log.cache_clear()
+        kwargs = dict(
+            log_path=health_log_file, game_port=1, control_port=1, skip_faults=True
+        )
+
+        first = build_health_report(**kwargs)
+        second = build_health_report(**kwargs)
+        assert reads["n"] == 1
+        assert second.tick == first.tick
+        with open(health_log_file, "a") as f:
+            f.write("\n")
+        build_health_report(**kwargs)
+        assert reads["n"] == 2
+
 
 class TestFormatHealthReportText:
     """Formatted output contains key sections."""
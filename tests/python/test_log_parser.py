@@ -1,6 +1,6 @@
 """Tests for wowsim.log_parser — telemetry parsing, filtering, summarizing, anomaly detection."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
 
@@ -12,10 +12,11 @@ from wowsim.log_parser import (
     parse_stream,
     summarize,
 )
+from wowsim.models import TelemetryEntry
 
 
 # ============================================================
-# Group A: TelemetryEntry Model & Line Parsing (3 tests)
+# Group A: TelemetryEntry Model & Line Parsing (4 tests)
 # ============================================================
 
 
@@ -42,15 +43,23 @@ class TestParseLine:
         assert entry.component == "server"
         assert entry.message == "Server shutting down"
 
+    def test_utc_timestamp_uses_stdlib_timezone(self, sample_metric_line: str) -> None:
+        """'Z' timestamps decode to datetime.timezone.utc, not a custom tzinfo."""
+        entry = parse_line(sample_metric_line)
+        assert entry is not None
+        assert entry.timestamp.tzinfo is timezone.utc
+
     def test_parse_invalid_json_returns_none(self) -> None:
         """Malformed JSON line returns None instead of raising."""
         assert parse_line("NOT VALID JSON") is None
         assert parse_line("") is None
         assert parse_line('{"v": 1}') is None  # missing required fields
+        assert parse_line(b"[1, 2]") is None  # JSON, but not an object
+        assert parse_line(b"  \t\n") is None
 
 
 # ============================================================
-# Group B: File/Stream Parsing (3 tests)
+# Group B: File/Stream Parsing (7 tests)
 # ============================================================
 
 
@@ -73,6 +82,52 @@ class TestFileParsing:
         assert len(entries) == 2
         assert all(e.component == "game_loop" for e in entries)
 
+    def test_parse_file_skips_blank_lines(
+        self, tmp_path: Path, sample_metric_line: str
+    ) -> None:
+        """Blank lines do not force the per-line fallback or yield entries."""
+        path = tmp_path / "blank.jsonl"
+        path.write_text(f"\n{sample_metric_line}\n\n{sample_metric_line}\n")
+        entries = parse_file(path)
+        assert len(entries) == 2
+
+    def test_parse_file_empty(self, tmp_path: Path) -> None:
+        """A zero-length file yields no entries (mmap rejects empty files)."""
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+        assert parse_file(path) == []
+
+    def test_parse_file_rejects_two_objects_on_one_line(
+        self, tmp_path: Path, sample_metric_line: str
+    ) -> None:
+        """A line holding two objects is dropped, as parse_line drops it."""
+        path = tmp_path / "joined.jsonl"
+        path.write_text(
+            f"{sample_metric_line}\n{sample_metric_line},{sample_metric_line}\n"
+        )
+        assert parse_line(f"{sample_metric_line},{sample_metric_line}") is None
+        assert len(parse_file(path)) == 1
+
+    def test_parse_file_partial_last_line_keeps_batch(
+        self, tmp_path: Path, sample_metric_line: str, monkeypatch
+    ) -> None:
+        """An unterminated partial last line is parsed alone, not per-line."""
+        import wowsim.log_parser as log_parser
+
+        calls: list[bytes] = []
+        real_parse_line = log_parser.parse_line
+
+        def counting_parse_line(line: bytes):
+            calls.append(line)
+            return real_parse_line(line)
+
+        monkeypatch.setattr(log_parser, "parse_line", counting_parse_line)
+        path = tmp_path / "partial.jsonl"
+        partial = '{"v": 1, "ti'
+        path.write_text(f"{sample_metric_line}\n{sample_metric_line}\n{partial}")
+        assert len(parse_file(path)) == 2
+        assert len(calls) == 1
+
     def test_parse_stream_from_stringio(self, sample_jsonl: str) -> None:
         """StringIO input produces the same entries as file parsing."""
         stream = StringIO(sample_jsonl)
@@ -84,7 +139,7 @@ class TestFileParsing:
 
 
 # ============================================================
-# Group C: Filtering (4 tests)
+# Group C: Filtering (5 tests)
 # ============================================================
 
 
@@ -112,6 +167,12 @@ class TestFiltering:
         assert len(filtered) == 1
         assert "Tick" in filtered[0].message
 
+    def test_filter_by_any_of_several_messages(self, sample_log_file: Path) -> None:
+        """Several message substrings keep entries matching any of them."""
+        entries = parse_file(sample_log_file)
+        filtered = filter_entries(entries, message_filter=["Tick", "disconnected"])
+        assert [e.component for e in filtered] == ["game_loop", "game_server"]
+
     def test_filter_combined(self, sample_log_file: Path) -> None:
         """Combining type + component filters applies both."""
         entries = parse_file(sample_log_file)
@@ -161,7 +222,7 @@ class TestSummarize:
 
 
 # ============================================================
-# Group E: Anomaly Detection (5 tests)
+# Group E: Anomaly Detection (7 tests)
 # ============================================================
 
 
@@ -216,6 +277,50 @@ class TestAnomalyDetection:
         assert len(bursts) >= 1
         assert bursts[0].severity == "critical"
 
+    def test_error_burst_window_is_inclusive(self) -> None:
+        """An error exactly window_sec after the first still counts."""
+        def errors_at(offsets: list[float]) -> list[TelemetryEntry]:
+            return [
+                TelemetryEntry(
+                    v=1,
+                    timestamp=datetime(2026, 2, 24, 10, 0, tzinfo=timezone.utc)
+                    + timedelta(seconds=off),
+                    type="error",
+                    component="game_server",
+                    message="Boom",
+                )
+                for off in offsets
+            ]
+
+        inside = detect_anomalies(errors_at([0.0, 2.5, 5.0, 7.5, 10.0]))
+        bursts = [a for a in inside if a.type == "error_burst"]
+        assert len(bursts) == 1
+        assert bursts[0].details["error_count"] == 5
+
+        outside = detect_anomalies(errors_at([0.0, 2.5, 5.0, 7.5, 10.001]))
+        assert [a for a in outside if a.type == "error_burst"] == []
+
+    def test_separate_error_bursts_each_reported(self) -> None:
+        """Bursts separated by a quiet gap yield one anomaly each."""
+        base = datetime(2026, 2, 24, 10, 0, tzinfo=timezone.utc)
+        offsets = [0, 1, 2, 3, 4, 5, 6, 60, 61, 62, 63, 64]
+        entries = [
+            TelemetryEntry(
+                v=1,
+                timestamp=base + timedelta(seconds=off),
+                type="error",
+                component="game_server",
+                message="Boom",
+            )
+            for off in offsets
+        ]
+        bursts = [a for a in detect_anomalies(entries) if a.type == "error_burst"]
+        assert [b.timestamp for b in bursts] == [
+            base,
+            base + timedelta(seconds=60),
+        ]
+        assert [b.details["error_count"] for b in bursts] == [7, 5]
+
     def test_detect_no_anomalies_clean_log(self, sample_metric_line: str) -> None:
         """Healthy entries produce no anomalies."""
         entry = parse_line(sample_metric_line)
@@ -408,3 +513,29 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Cast" in result.output or "Spell" in result.output
         assert "Combat" in result.output
+
+    def test_cli_parse_logs_json_matches_parse_result(
+        self, tmp_path: Path, entries_with_anomalies: list[str]
+    ) -> None:
+        """Streamed --format json output equals a dumped ParseResult."""
+        from click.testing import CliRunner
+
+        from wowsim.cli import main
+        from wowsim.models import ParseResult
+
+        log_file = tmp_path / "anomalies.jsonl"
+        log_file.write_text("\n".join(entries_with_anomalies) + "\n")
+        entries = parse_file(log_file)
+        expected = ParseResult(
+            entries=entries,
+            summary=summarize(entries),
+            anomalies=detect_anomalies(entries),
+        ).model_dump_json(indent=2)
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["parse-logs", str(log_file), "--format", "json"]
+        )
+        assert result.exit_code == 0
+        assert expected.count('"type"') > 1
+        assert result.output == expected + "\n"
@@ -2,10 +2,10 @@
 
 Groups:
   A — Mock Client Models (3 tests)
-  B — Traffic Generation (3 tests)
+  B — Traffic Generation (5 tests)
   C — Action Selection (2 tests)
-  D — Single Client Lifecycle (3 tests)
-  E — Multi-Client Spawning (3 tests)
+  D — Single Client Lifecycle (8 tests)
+  E — Multi-Client Spawning (5 tests)
   F — Formatting (2 tests)
   G — CLI Integration (2 tests)
 """
@@ -115,6 +115,32 @@ class TestTrafficGeneration:
         assert 10 <= action["base_damage"] <= 50
         assert action["damage_type"] in ("PHYSICAL", "MAGICAL")
 
+    def test_wire_payload_matches_json_dumps(self) -> None:
+        """Queued payloads are json.dumps of choose_action with the client's RNG."""
+        import json
+        import random
+
+        from wowsim.mock_client import MockGameClient, choose_action
+
+        for seed in range(50):
+            action = choose_action(7, 0.0, 0.0, 0.0, rng=random.Random(seed))
+            expected = json.dumps(action) + "\n"
+            client = MockGameClient(client_id=7, host="127.0.0.1", port=1, seed=seed)
+            assert client._generate_payload() == expected.encode()
+
+    def test_clients_draw_from_independent_generators(self) -> None:
+        """Seeded clients repeat their own sequence regardless of the global RNG."""
+        import random
+
+        from wowsim.mock_client import MockGameClient
+
+        a = MockGameClient(client_id=1, host="127.0.0.1", port=1, seed=11)
+        first = [a._generate_payload() for _ in range(5)]
+        random.seed(0)
+        b = MockGameClient(client_id=1, host="127.0.0.1", port=1, seed=11)
+        random.random()
+        assert [b._generate_payload() for _ in range(5)] == first
+
 
 # ---------------------------------------------------------------------------
 # Group C: Action Selection
@@ -134,11 +160,17 @@ class TestActionSelection:
         assert types == {"movement", "spell_cast", "combat"}
 
     def test_choose_action_weight_distribution(self) -> None:
-        counts: dict[str, int] = {"movement": 0, "spell_cast": 0, "combat": 0}
+        import random
+        from collections import Counter
+
+        # A private generator keeps the bounds check deterministic without
+        # touching the global RNG.
+        rng = random.Random(0)
         n = 1000
-        for _ in range(n):
-            action = choose_action(client_id=0, x=0.0, y=0.0, z=0.0)
-            counts[action["type"]] += 1
+        counts = Counter(
+            choose_action(client_id=0, x=0.0, y=0.0, z=0.0, rng=rng)["type"]
+            for _ in range(n)
+        )
 
         # Expected: movement ~50%, spell_cast ~30%, combat ~20% (±15%)
         assert abs(counts["movement"] / n - 0.50) < 0.15
@@ -157,61 +189,116 @@ import time
 from wowsim.mock_client import MockGameClient
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSingleClientLifecycle:
     """Verify individual mock client connect, send, and run loop."""
 
-    def test_mock_client_connect_timeout(self) -> None:
+    async def test_mock_client_connect_timeout(self) -> None:
         """Connection to unreachable host times out instead of hanging."""
 
-        async def _test() -> None:
-            # Port 1 on loopback — nothing listening, should time out quickly
-            client = MockGameClient(client_id=0, host="127.0.0.1", port=1)
-            with pytest.raises((OSError, asyncio.TimeoutError)):
-                await client.connect(timeout=0.5)
-
-        asyncio.run(_test())
+        # Port 1 on loopback — nothing listening, should time out quickly
+        client = MockGameClient(client_id=0, host="127.0.0.1", port=1)
+        with pytest.raises((OSError, asyncio.TimeoutError)):
+            await client.connect(timeout=0.5)
 
-    def test_mock_client_connects(self, mock_game_server: dict) -> None:
+    async def test_mock_client_connects(self, mock_game_server: dict) -> None:
         host, port = mock_game_server["host"], mock_game_server["port"]
         server = mock_game_server["server"]
 
-        async def _test() -> None:
-            async with MockGameClient(client_id=0, host=host, port=port) as client:
-                assert client.connected
-            # Give server time to register the connection
-            await asyncio.sleep(0.05)
-
-        asyncio.run(_test())
+        async with MockGameClient(client_id=0, host=host, port=port) as client:
+            assert client.connected
+        # Give server time to register the connection
+        await asyncio.sleep(0.05)
         assert server.connection_count >= 1
 
-    def test_mock_client_sends_actions(self, mock_game_server: dict) -> None:
+    async def test_mock_client_sends_actions(self, mock_game_server: dict) -> None:
         host, port = mock_game_server["host"], mock_game_server["port"]
         server = mock_game_server["server"]
 
-        async def _test() -> None:
-            async with MockGameClient(client_id=0, host=host, port=port) as client:
-                await client.send_action()
-                await client.send_action()
-                await asyncio.sleep(0.05)
+        async with MockGameClient(client_id=0, host=host, port=port) as client:
+            await client.send_action()
+            await client.send_action()
+            await asyncio.sleep(0.05)
+        assert server.bytes_received > 0
+
+    async def test_queued_actions_written_on_close(
+        self, mock_game_server: dict
+    ) -> None:
+        """A partial batch still reaches the server when the client closes."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        server = mock_game_server["server"]
 
-        asyncio.run(_test())
+        client = MockGameClient(client_id=0, host=host, port=port)
+        await client.connect()
+        await client.send_action()
+        await client.close()
+        await asyncio.sleep(0.05)
         assert server.bytes_received > 0
 
-    def test_mock_client_run_loop(self, mock_game_server: dict) -> None:
+    async def test_full_batch_written_immediately(self) -> None:
+        """Reaching SEND_BATCH_SIZE writes the whole batch in one call."""
+        from wowsim.mock_client import SEND_BATCH_SIZE
+
+        class _Writer:
+            def __init__(self) -> None:
+                self.batches: list[list[bytes]] = []
+
+            def writelines(self, data: list[bytes]) -> None:
+                self.batches.append(list(data))
+
+            async def drain(self) -> None:
+                pass
+
+        client = MockGameClient(client_id=0, host="127.0.0.1", port=1)
+        writer = _Writer()
+        client._writer = writer  # type: ignore[assignment]
+        for _ in range(SEND_BATCH_SIZE):
+            await client.send_action()
+        assert [len(b) for b in writer.batches] == [SEND_BATCH_SIZE]
+
+    async def test_mock_client_run_loop(self, mock_game_server: dict) -> None:
         host, port = mock_game_server["host"], mock_game_server["port"]
         cfg = ClientConfig(
             host=host, port=port, actions_per_second=20.0, duration_seconds=0.5
         )
 
-        async def _test() -> ClientResult:
-            client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
-            return await client.run(cfg)
-
-        result = asyncio.run(_test())
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        result = await client.run(cfg)
         assert result.connected is True
         assert result.actions_sent >= 1
         assert result.error is None
 
+    async def test_run_loop_keeps_high_rate(self, mock_game_server: dict) -> None:
+        """Rates above one action per pacing tick are sent in bursts, not dropped."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        cfg = ClientConfig(
+            host=host, port=port, actions_per_second=500.0, duration_seconds=0.4
+        )
+
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        result = await client.run(cfg)
+        assert result.connected is True
+        # 500/s for 0.4s is 200 actions; allow slack for scheduler jitter.
+        assert 150 <= result.actions_sent <= 205
+
+    async def test_connect_wait_not_sent_as_burst(self, mock_game_server: dict) -> None:
+        """Time spent waiting for a connect slot doesn't count toward pacing."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        cfg = ClientConfig(
+            host=host, port=port, actions_per_second=20.0, duration_seconds=0.5
+        )
+        slots = asyncio.Semaphore(1)
+        await slots.acquire()
+
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        task = asyncio.create_task(client.run(cfg, connect_slots=slots))
+        await asyncio.sleep(0.3)
+        slots.release()
+        result = await task
+        assert result.connected is True
+        # ~0.2s left at 20/s is ~4 actions; a backlog burst would send ~10.
+        assert result.actions_sent <= 6
+
 
 # ---------------------------------------------------------------------------
 # Group E: Multi-Client Spawning
@@ -220,39 +307,69 @@ class TestSingleClientLifecycle:
 from wowsim.mock_client import spawn_clients
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestMultiClientSpawning:
     """Verify concurrent client spawning and failure handling."""
 
-    def test_spawn_clients_all_connect(self, mock_game_server: dict) -> None:
+    async def test_spawn_clients_all_connect(self, mock_game_server: dict) -> None:
         host, port = mock_game_server["host"], mock_game_server["port"]
         cfg = ClientConfig(
             host=host, port=port, actions_per_second=10.0, duration_seconds=0.5
         )
-        result = asyncio.run(spawn_clients(cfg, count=5))
+        result = await spawn_clients(cfg, count=5)
         assert result.total_clients == 5
         assert result.successful_connections == 5
         assert result.failed_connections == 0
 
-    def test_spawn_clients_connection_failure(self) -> None:
+    async def test_spawn_clients_connection_failure(self) -> None:
         cfg = ClientConfig(
             host="127.0.0.1", port=1, actions_per_second=1.0, duration_seconds=0.5
         )
-        result = asyncio.run(spawn_clients(cfg, count=3))
+        result = await spawn_clients(cfg, count=3)
         assert result.total_clients == 3
         assert result.failed_connections == 3
         assert result.successful_connections == 0
         for client in result.clients:
             assert client.error is not None
 
-    def test_spawn_clients_server_receives_data(self, mock_game_server: dict) -> None:
+    async def test_spawn_clients_server_receives_data(
+        self, mock_game_server: dict
+    ) -> None:
         host, port = mock_game_server["host"], mock_game_server["port"]
         server = mock_game_server["server"]
         cfg = ClientConfig(
             host=host, port=port, actions_per_second=20.0, duration_seconds=0.5
         )
-        asyncio.run(spawn_clients(cfg, count=10))
+        await spawn_clients(cfg, count=10)
         assert server.bytes_received > 0
 
+    async def test_resolve_host_once(self) -> None:
+        """Single-address hosts resolve to a numeric address; others pass through."""
+        from wowsim.mock_client import _resolve_host
+
+        assert await _resolve_host("127.0.0.1", 8080) == "127.0.0.1"
+        assert await _resolve_host("localhost", 8080) in {
+            "localhost",
+            "127.0.0.1",
+            "::1",
+        }
+
+    async def test_spawn_clients_bounded_connects(
+        self, mock_game_server: dict
+    ) -> None:
+        """More clients than connect slots still all connect and run."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        cfg = ClientConfig(
+            host=host,
+            port=port,
+            actions_per_second=10.0,
+            duration_seconds=0.3,
+            max_concurrent_connects=2,
+        )
+        result = await spawn_clients(cfg, count=6)
+        assert result.successful_connections == 6
+        assert all(c.actions_sent >= 1 for c in result.clients)
+
 
 # ---------------------------------------------------------------------------
 # Group F: Formatting
@@ -367,18 +484,44 @@ class TestCLI:
         data = _json.loads(result.output)
         assert data["total_clients"] == 2
 
+    def test_cli_spawn_clients_max_connects(self, mock_game_server: dict) -> None:
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "spawn-clients",
+                "--count", "4",
+                "--duration", "0.3",
+                "--host", host,
+                "--port", str(port),
+                "--max-connects", "1",
+                "--format", "json",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        import json as _json
+
+        data = _json.loads(result.output)
+        assert data["successful_connections"] == 4
+
 
 # ---------------------------------------------------------------------------
-# Group H: Stop Event Early Termination (4 tests)
+# Group H: Stop Event Early Termination (8 tests)
 # ---------------------------------------------------------------------------
 
 import threading
 
+from wowsim.mock_client import ThreadStopEvent
 
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestStopEvent:
     """Verify stop_event causes early termination of client run loops."""
 
-    def test_stop_event_terminates_client_run_early(self, mock_game_server: dict) -> None:
+    async def test_stop_event_terminates_client_run_early(
+        self, mock_game_server: dict
+    ) -> None:
         """Setting stop_event mid-run causes client to stop before duration expires."""
         host, port = mock_game_server["host"], mock_game_server["port"]
         stop_event = threading.Event()
@@ -386,19 +529,18 @@ class TestStopEvent:
             host=host, port=port, actions_per_second=20.0, duration_seconds=30.0
         )
 
-        async def _test() -> ClientResult:
-            client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
-            # Signal stop after a short delay
-            loop = asyncio.get_event_loop()
-            loop.call_later(0.3, stop_event.set)
-            return await client.run(cfg, stop_event=stop_event)
-
-        result = asyncio.run(_test())
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        # Signal stop after a short delay
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.3, stop_event.set)
+        result = await client.run(cfg, stop_event=stop_event)
         assert result.connected is True
         # Should have stopped well before the 30s duration
         assert result.duration_seconds < 5.0
 
-    def test_stop_event_terminates_spawn_clients_early(self, mock_game_server: dict) -> None:
+    async def test_stop_event_terminates_spawn_clients_early(
+        self, mock_game_server: dict
+    ) -> None:
         """Setting stop_event terminates all spawned clients early."""
         host, port = mock_game_server["host"], mock_game_server["port"]
         stop_event = threading.Event()
@@ -406,17 +548,16 @@ class TestStopEvent:
             host=host, port=port, actions_per_second=10.0, duration_seconds=30.0
         )
 
-        async def _test() -> SpawnResult:
-            loop = asyncio.get_event_loop()
-            loop.call_later(0.3, stop_event.set)
-            return await spawn_clients(cfg, count=3, stop_event=stop_event)
-
-        result = asyncio.run(_test())
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.3, stop_event.set)
+        result = await spawn_clients(cfg, count=3, stop_event=stop_event)
         assert result.total_clients == 3
         # All clients should have finished well before 30s
         assert result.total_duration_seconds < 5.0
 
-    def test_persistent_duration_with_stop_event(self, mock_game_server: dict) -> None:
+    async def test_persistent_duration_with_stop_event(
+        self, mock_game_server: dict
+    ) -> None:
         """Infinite duration runs until stop_event is set."""
         host, port = mock_game_server["host"], mock_game_server["port"]
         stop_event = threading.Event()
@@ -424,28 +565,78 @@ class TestStopEvent:
             host=host, port=port, actions_per_second=20.0, duration_seconds=float("inf")
         )
 
-        async def _test() -> ClientResult:
-            client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
-            loop = asyncio.get_event_loop()
-            loop.call_later(0.3, stop_event.set)
-            return await client.run(cfg, stop_event=stop_event)
-
-        result = asyncio.run(_test())
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.3, stop_event.set)
+        result = await client.run(cfg, stop_event=stop_event)
         assert result.connected is True
         assert result.duration_seconds < 5.0
         assert result.actions_sent >= 1
 
-    def test_none_stop_event_preserves_behavior(self, mock_game_server: dict) -> None:
+    async def test_persistent_spawn_clients_with_stop_event(
+        self, mock_game_server: dict
+    ) -> None:
+        """spawn_clients accepts an infinite duration and stops on the event."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        stop_event = threading.Event()
+        cfg = ClientConfig(
+            host=host, port=port, actions_per_second=20.0, duration_seconds=float("inf")
+        )
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.3, stop_event.set)
+        result = await spawn_clients(cfg, count=2, stop_event=stop_event)
+        assert result.successful_connections == 2
+        assert result.total_duration_seconds < 5.0
+
+    async def test_asyncio_stop_event_wakes_run_immediately(
+        self, mock_game_server: dict
+    ) -> None:
+        """An asyncio.Event stop ends a slow-paced run without waiting a tick."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        stop_event = asyncio.Event()
+        cfg = ClientConfig(
+            host=host, port=port, actions_per_second=0.5, duration_seconds=30.0
+        )
+
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, stop_event.set)
+        result = await client.run(cfg, stop_event=stop_event)
+        assert result.connected is True
+        # At 0.5 actions/s the next send is 2s away; the event cuts that short.
+        assert result.duration_seconds < 1.0
+        assert result.actions_sent == 1
+
+    async def test_thread_stop_event_wakes_spawn_from_another_thread(
+        self, mock_game_server: dict
+    ) -> None:
+        """A ThreadStopEvent set off-loop ends a slow-paced spawn at once."""
+        host, port = mock_game_server["host"], mock_game_server["port"]
+        stop_event = ThreadStopEvent()
+        cfg = ClientConfig(
+            host=host, port=port, actions_per_second=0.5, duration_seconds=30.0
+        )
+
+        timer = threading.Timer(0.1, stop_event.set)
+        timer.start()
+        result = await spawn_clients(cfg, count=2, stop_event=stop_event)
+        timer.join()
+        # At 0.5 actions/s the next send is 2s away; the event cuts that short.
+        assert result.successful_connections == 2
+        assert result.total_duration_seconds < 1.0
+        assert result.total_actions_sent == 2
+
+    async def test_none_stop_event_preserves_behavior(
+        self, mock_game_server: dict
+    ) -> None:
         """Passing no stop_event (default None) behaves as before."""
         host, port = mock_game_server["host"], mock_game_server["port"]
         cfg = ClientConfig(
             host=host, port=port, actions_per_second=20.0, duration_seconds=0.5
         )
 
-        async def _test() -> ClientResult:
-            client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
-            return await client.run(cfg, stop_event=None)
-
-        result = asyncio.run(_test())
+        client = MockGameClient(client_id=0, host=cfg.host, port=cfg.port)
+        result = await client.run(cfg, stop_event=None)
         assert result.connected is True
         assert result.actions_sent >= 1
@@ -3,82 +3,90 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 
 import pytest
+from click.testing import CliRunner
+from pydantic import TypeAdapter
 
+from wowsim import pipeline
+from wowsim.cli import main
+from wowsim.models import HealthReport, PipelineConfig, PipelineResult, StageResult
+from wowsim.pipeline import (
+    check_build_preconditions,
+    check_validate_gate,
+    determine_rollback_action,
+    evaluate_canary_health,
+    format_pipeline_result,
+    format_stage_result,
+)
 
-# ============================================================
-# Group A: Pipeline Models (3 tests)
-# ============================================================
+# Fixed report timestamp shared by every HealthReport in this module.
+_TS = datetime(2026, 2, 24, tzinfo=timezone.utc)
 
+_PIPELINE_RESULT_ADAPTER: TypeAdapter[PipelineResult] = TypeAdapter(PipelineResult)
 
-class TestPipelineConfigDefaults:
-    """PipelineConfig provides sensible defaults for optional fields."""
 
-    def test_defaults(self) -> None:
-        from wowsim.models import PipelineConfig
+# ============================================================
+# Group A: Pipeline Models (4 tests)
+# ============================================================
 
-        config = PipelineConfig(fault_id="latency-spike", action="activate")
-        assert config.version == "1.0.0"
-        assert config.fault_id == "latency-spike"
-        assert config.action == "activate"
-        assert config.params == {}
-        assert config.target_zone_id == 0
-        assert config.duration_ticks == 0
-        assert config.canary_duration_seconds == 10.0
-        assert config.canary_poll_interval_seconds == 2.0
-        assert config.rollback_on == "critical"
-        assert config.game_host == "localhost"
-        assert config.game_port == 8080
-        assert config.control_host == "localhost"
-        assert config.control_port == 8081
-        assert config.log_file is None
-
-
-class TestPipelineConfigCustomOverrides:
-    """PipelineConfig accepts custom values for all fields."""
-
-    def test_overrides(self) -> None:
-        from wowsim.models import PipelineConfig
 
-        config = PipelineConfig(
-            fault_id="memory-pressure",
-            action="deactivate",
-            version="2.0.0",
-            params={"megabytes": 256},
-            target_zone_id=1,
-            duration_ticks=100,
-            canary_duration_seconds=30.0,
-            canary_poll_interval_seconds=5.0,
-            rollback_on="degraded",
-            game_host="10.0.0.1",
-            game_port=9090,
-            control_host="10.0.0.2",
-            control_port=9091,
-            log_file="telemetry.jsonl",
-        )
-        assert config.fault_id == "memory-pressure"
-        assert config.action == "deactivate"
-        assert config.version == "2.0.0"
-        assert config.params == {"megabytes": 256}
-        assert config.target_zone_id == 1
-        assert config.duration_ticks == 100
-        assert config.canary_duration_seconds == 30.0
-        assert config.canary_poll_interval_seconds == 5.0
-        assert config.rollback_on == "degraded"
-        assert config.game_host == "10.0.0.1"
-        assert config.game_port == 9090
-        assert config.control_host == "10.0.0.2"
-        assert config.control_port == 9091
-        assert config.log_file == "telemetry.jsonl"
+_CONFIG_DEFAULTS = {
+    "version": "1.0.0",
+    "fault_id": "latency-spike",
+    "action": "activate",
+    "params": {},
+    "target_zone_id": 0,
+    "duration_ticks": 0,
+    "canary_duration_seconds": 10.0,
+    "canary_poll_interval_seconds": 2.0,
+    "rollback_on": "critical",
+    "game_host": "localhost",
+    "game_port": 8080,
+    "control_host": "localhost",
+    "control_port": 8081,
+    "log_file": None,
+}
+
+_CONFIG_OVERRIDES = {
+    "fault_id": "memory-pressure",
+    "action": "deactivate",
+    "version": "2.0.0",
+    "params": {"megabytes": 256},
+    "target_zone_id": 1,
+    "duration_ticks": 100,
+    "canary_duration_seconds": 30.0,
+    "canary_poll_interval_seconds": 5.0,
+    "rollback_on": "degraded",
+    "game_host": "10.0.0.1",
+    "game_port": 9090,
+    "control_host": "10.0.0.2",
+    "control_port": 9091,
+    "log_file": "telemetry.jsonl",
+}
+
+
+class TestPipelineConfigFields:
+    """PipelineConfig fills defaults and accepts custom values for all fields."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"fault_id": "latency-spike", "action": "activate"}, _CONFIG_DEFAULTS),
+            (_CONFIG_OVERRIDES, _CONFIG_OVERRIDES),
+        ],
+        ids=["defaults", "overrides"],
+    )
+    def test_fields(self, kwargs: dict, expected: dict) -> None:
+        config = PipelineConfig(**kwargs)
+        assert config.model_dump() == expected
 
 
 class TestPipelineModelsJsonRoundTrip:
     """PipelineResult serializes to JSON and deserializes back."""
 
     def test_round_trip(self) -> None:
-        from wowsim.models import PipelineConfig, PipelineResult, StageResult
-
         config = PipelineConfig(fault_id="latency-spike", action="activate")
         stages = [
             StageResult(
@@ -102,7 +110,7 @@ class TestPipelineModelsJsonRoundTrip:
             total_duration_seconds=1.5,
         )
         json_str = result.model_dump_json()
-        restored = PipelineResult.model_validate_json(json_str)
+        restored = _PIPELINE_RESULT_ADAPTER.validate_json(json_str)
         assert restored.outcome == "promoted"
         assert len(restored.stages) == 2
         assert restored.stages[0].stage == "build"
@@ -111,46 +119,49 @@ class TestPipelineModelsJsonRoundTrip:
         assert restored.config.fault_id == "latency-spike"
         assert restored.total_duration_seconds == 1.5
 
+    def test_python_dump_round_trip(self) -> None:
+        """In-process copies can skip JSON: model_dump() + model_validate()."""
+        result = PipelineResult(
+            config=PipelineConfig(fault_id="latency-spike", action="activate"),
+            stages=[StageResult(stage="build", passed=True, message="ok")],
+            outcome="promoted",
+            total_duration_seconds=1.5,
+        )
+        restored = PipelineResult.model_validate(result.model_dump())
+        assert restored == result
+
 
 # ============================================================
 # Group B: Build Preconditions (3 tests)
 # ============================================================
 
 
-class TestBuildPassesHealthy:
-    """Build stage passes when server is reachable and healthy."""
-
-    def test_passes_healthy(self) -> None:
-        from wowsim.pipeline import check_build_preconditions
-
-        result = check_build_preconditions(reachable=True, status="healthy")
-        assert result.stage == "build"
-        assert result.passed is True
-        assert result.health_status == "healthy"
-
-
-class TestBuildFailsUnreachable:
-    """Build stage fails when server is unreachable."""
-
-    def test_fails_unreachable(self) -> None:
-        from wowsim.pipeline import check_build_preconditions
-
-        result = check_build_preconditions(reachable=False, status="healthy")
-        assert result.stage == "build"
-        assert result.passed is False
-        assert "unreachable" in result.message.lower()
-
+class TestBuildPreconditions:
+    """Build stage requires a reachable, non-critical server."""
 
-class TestBuildFailsCritical:
-    """Build stage fails when server status is critical."""
-
-    def test_fails_critical(self) -> None:
-        from wowsim.pipeline import check_build_preconditions
-
-        result = check_build_preconditions(reachable=True, status="critical")
+    @pytest.mark.parametrize(
+        ("reachable", "status", "expected_pass", "message_part"),
+        [
+            (True, "healthy", True, None),
+            (False, "healthy", False, "unreachable"),
+            (True, "critical", False, "critical"),
+        ],
+        ids=["passes_healthy", "fails_unreachable", "fails_critical"],
+    )
+    def test_build(
+        self,
+        reachable: bool,
+        status: str,
+        expected_pass: bool,
+        message_part: str | None,
+    ) -> None:
+        result = check_build_preconditions(reachable=reachable, status=status)
         assert result.stage == "build"
-        assert result.passed is False
-        assert "critical" in result.message.lower()
+        assert result.passed is expected_pass
+        if expected_pass:
+            assert result.health_status == status
+        else:
+            assert message_part in result.message.lower()
 
 
 # ============================================================
@@ -158,44 +169,25 @@ class TestBuildFailsCritical:
 # ============================================================
 
 
-class TestValidatePassesReachable:
-    """Validate stage passes when server is reachable."""
-
-    def test_passes(self) -> None:
-        from wowsim.pipeline import check_validate_gate
-
-        from wowsim.models import HealthReport
-        from datetime import datetime, timezone
-
-        report = HealthReport(
-            timestamp=datetime(2026, 2, 24, tzinfo=timezone.utc),
-            status="healthy",
-            server_reachable=True,
-        )
-        result = check_validate_gate(report)
-        assert result.stage == "validate"
-        assert result.passed is True
-        assert result.health_status == "healthy"
-
-
-class TestValidateFailsUnreachable:
-    """Validate stage fails when server is unreachable."""
-
-    def test_fails(self) -> None:
-        from wowsim.pipeline import check_validate_gate
-
-        from wowsim.models import HealthReport
-        from datetime import datetime, timezone
+class TestValidateGate:
+    """Validate stage passes only when the server is reachable."""
 
-        report = HealthReport(
-            timestamp=datetime(2026, 2, 24, tzinfo=timezone.utc),
+    @pytest.mark.parametrize(
+        "reachable", [True, False], ids=["passes_reachable", "fails_unreachable"]
+    )
+    def test_validate(self, reachable: bool) -> None:
+        report = HealthReport.model_construct(
+            timestamp=_TS,
             status="healthy",
-            server_reachable=False,
+            server_reachable=reachable,
         )
         result = check_validate_gate(report)
         assert result.stage == "validate"
-        assert result.passed is False
-        assert "unreachable" in result.message.lower()
+        assert result.passed is reachable
+        if reachable:
+            assert result.health_status == "healthy"
+        else:
+            assert "unreachable" in result.message.lower()
 
 
 # ============================================================
@@ -203,39 +195,25 @@ class TestValidateFailsUnreachable:
 # ============================================================
 
 
-class TestCanaryPassesAllHealthy:
-    """Canary passes when all health samples are below threshold."""
-
-    def test_passes(self) -> None:
-        from wowsim.pipeline import evaluate_canary_health
-
-        samples = ["healthy", "healthy", "degraded", "healthy"]
-        passed, message = evaluate_canary_health(samples, threshold="critical")
-        assert passed is True
-
-
-class TestCanaryFailsOnCritical:
-    """Canary fails on first critical sample when threshold is critical."""
-
-    def test_fails_critical(self) -> None:
-        from wowsim.pipeline import evaluate_canary_health
-
-        samples = ["healthy", "critical", "healthy"]
-        passed, message = evaluate_canary_health(samples, threshold="critical")
-        assert passed is False
-        assert "critical" in message.lower()
-
+class TestCanaryEvaluation:
+    """Canary fails on the first sample at or above the threshold."""
 
-class TestCanaryFailsOnDegradedThreshold:
-    """Canary fails on degraded sample when threshold is degraded."""
-
-    def test_fails_degraded(self) -> None:
-        from wowsim.pipeline import evaluate_canary_health
-
-        samples = ["healthy", "degraded", "healthy"]
-        passed, message = evaluate_canary_health(samples, threshold="degraded")
-        assert passed is False
-        assert "degraded" in message.lower()
+    @pytest.mark.parametrize(
+        ("samples", "threshold", "expected_pass"),
+        [
+            (["healthy", "healthy", "degraded", "healthy"], "critical", True),
+            (["healthy", "critical", "healthy"], "critical", False),
+            (["healthy", "degraded", "healthy"], "degraded", False),
+        ],
+        ids=["passes_all_healthy", "fails_critical", "fails_degraded_threshold"],
+    )
+    def test_canary(
+        self, samples: list[str], threshold: str, expected_pass: bool
+    ) -> None:
+        passed, message = evaluate_canary_health(samples, threshold=threshold)
+        assert passed is expected_pass
+        if not expected_pass:
+            assert threshold in message.lower()
 
 
 # ============================================================
@@ -243,30 +221,20 @@ class TestCanaryFailsOnDegradedThreshold:
 # ============================================================
 
 
-class TestRollbackReversesActivate:
-    """Rollback of 'activate' returns 'deactivate'."""
-
-    def test_reverse_activate(self) -> None:
-        from wowsim.pipeline import determine_rollback_action
-        from wowsim.models import PipelineConfig
-
-        config = PipelineConfig(fault_id="latency-spike", action="activate")
-        action, fault_id = determine_rollback_action(config)
-        assert action == "deactivate"
-        assert fault_id == "latency-spike"
+class TestRollbackAction:
+    """Rollback reverses the deployed action for the same fault."""
 
-
-class TestRollbackReversesDeactivate:
-    """Rollback of 'deactivate' returns 'activate'."""
-
-    def test_reverse_deactivate(self) -> None:
-        from wowsim.pipeline import determine_rollback_action
-        from wowsim.models import PipelineConfig
-
-        config = PipelineConfig(fault_id="memory-pressure", action="deactivate")
-        action, fault_id = determine_rollback_action(config)
-        assert action == "activate"
-        assert fault_id == "memory-pressure"
+    @pytest.mark.parametrize(
+        ("fault_id", "action", "expected_action"),
+        [
+            ("latency-spike", "activate", "deactivate"),
+            ("memory-pressure", "deactivate", "activate"),
+        ],
+        ids=["reverses_activate", "reverses_deactivate"],
+    )
+    def test_reverse(self, fault_id: str, action: str, expected_action: str) -> None:
+        config = PipelineConfig(fault_id=fault_id, action=action)
+        assert determine_rollback_action(config) == (expected_action, fault_id)
 
 
 # ============================================================
@@ -278,10 +246,7 @@ class TestFormatStageResult:
     """format_stage_result produces a one-line summary."""
 
     def test_format(self) -> None:
-        from wowsim.pipeline import format_stage_result
-        from wowsim.models import StageResult
-
-        result = StageResult(
+        result = StageResult.model_construct(
             stage="build",
             passed=True,
             message="Build preconditions met",
@@ -298,31 +263,28 @@ class TestFormatPipelineResult:
     """format_pipeline_result produces a multi-line report."""
 
     def test_format(self) -> None:
-        from wowsim.pipeline import format_pipeline_result
-        from wowsim.models import PipelineConfig, PipelineResult, StageResult
-
-        config = PipelineConfig(
+        config = PipelineConfig.model_construct(
             fault_id="latency-spike", action="activate", version="1.0.0"
         )
         stages = [
-            StageResult(
+            StageResult.model_construct(
                 stage="build", passed=True, message="OK",
                 duration_seconds=0.1, health_status="healthy",
             ),
-            StageResult(
+            StageResult.model_construct(
                 stage="validate", passed=True, message="OK",
                 duration_seconds=0.2, health_status="healthy",
             ),
-            StageResult(
+            StageResult.model_construct(
                 stage="canary", passed=True, message="Canary passed",
                 duration_seconds=5.0, health_status="healthy",
             ),
-            StageResult(
+            StageResult.model_construct(
                 stage="promote", passed=True, message="Promoted",
                 duration_seconds=0.0,
             ),
         ]
-        result = PipelineResult(
+        result = PipelineResult.model_construct(
             config=config,
             stages=stages,
             outcome="promoted",
@@ -338,53 +300,42 @@ class TestFormatPipelineResult:
 
 
 # ============================================================
-# Group G: Orchestration with monkeypatch (3 tests)
+# Group G: Orchestration with monkeypatch (4 tests)
 # ============================================================
 
 
-def _make_healthy_report():
-    """Helper: a healthy, reachable HealthReport."""
-    from datetime import datetime, timezone
-    from wowsim.models import HealthReport
+# Shared, frozen reports: built once at import instead of per test or per
+# canary poll.
+_HEALTHY_REPORT = HealthReport.model_construct(
+    timestamp=_TS, status="healthy", server_reachable=True
+)
+_CRITICAL_REPORT = HealthReport.model_construct(
+    timestamp=_TS, status="critical", server_reachable=True
+)
+_UNREACHABLE_REPORT = HealthReport.model_construct(
+    timestamp=_TS, status="healthy", server_reachable=False
+)
 
-    return HealthReport(
-        timestamp=datetime(2026, 2, 24, tzinfo=timezone.utc),
-        status="healthy",
-        server_reachable=True,
-    )
 
+def _make_healthy_report() -> HealthReport:
+    """Helper: a healthy, reachable HealthReport."""
+    return _HEALTHY_REPORT
 
-def _make_critical_report():
-    """Helper: a critical HealthReport."""
-    from datetime import datetime, timezone
-    from wowsim.models import HealthReport
 
-    return HealthReport(
-        timestamp=datetime(2026, 2, 24, tzinfo=timezone.utc),
-        status="critical",
-        server_reachable=True,
-    )
+def _make_critical_report() -> HealthReport:
+    """Helper: a critical HealthReport."""
+    return _CRITICAL_REPORT
 
 
-def _make_unreachable_report():
+def _make_unreachable_report() -> HealthReport:
     """Helper: an unreachable HealthReport."""
-    from datetime import datetime, timezone
-    from wowsim.models import HealthReport
-
-    return HealthReport(
-        timestamp=datetime(2026, 2, 24, tzinfo=timezone.utc),
-        status="healthy",
-        server_reachable=False,
-    )
+    return _UNREACHABLE_REPORT
 
 
 class TestOrchestratorHappyPath:
     """Pipeline promotes when all stages pass."""
 
     def test_promote(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from wowsim import pipeline
-        from wowsim.models import PipelineConfig
-
         report = _make_healthy_report()
         monkeypatch.setattr(pipeline, "_get_health_report", lambda _cfg: report)
         monkeypatch.setattr(pipeline, "_execute_deploy_action", lambda _cfg: None)
@@ -409,9 +360,6 @@ class TestOrchestratorRollbackOnCritical:
     """Pipeline rolls back when canary detects critical health."""
 
     def test_rollback(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from wowsim import pipeline
-        from wowsim.models import PipelineConfig
-
         healthy = _make_healthy_report()
         critical = _make_critical_report()
         call_count = {"n": 0}
@@ -444,9 +392,6 @@ class TestOrchestratorAbortOnBuildFail:
     """Pipeline aborts when build preconditions fail."""
 
     def test_abort(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        from wowsim import pipeline
-        from wowsim.models import PipelineConfig
-
         unreachable = _make_unreachable_report()
         monkeypatch.setattr(pipeline, "_get_health_report", lambda _cfg: unreachable)
 
@@ -461,6 +406,33 @@ class TestOrchestratorAbortOnBuildFail:
         assert result.stages[0].passed is False
 
 
+class TestOrchestratorAsync:
+    """run_pipeline_async lets canary waits overlap on one event loop."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pipelines(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import asyncio
+        import time
+
+        report = _make_healthy_report()
+        monkeypatch.setattr(pipeline, "_get_health_report", lambda _cfg: report)
+        monkeypatch.setattr(pipeline, "_execute_deploy_action", lambda _cfg: None)
+
+        config = PipelineConfig(
+            fault_id="latency-spike",
+            action="activate",
+            canary_duration_seconds=0.4,
+            canary_poll_interval_seconds=0.2,
+        )
+        start = time.monotonic()
+        results = await asyncio.gather(
+            pipeline.run_pipeline_async(config), pipeline.run_pipeline_async(config)
+        )
+        assert [r.outcome for r in results] == ["promoted", "promoted"]
+        # Sequential canaries would take at least 0.8s.
+        assert time.monotonic() - start < 0.7
+
+
 # ============================================================
 # Group H: CLI Integration (2 tests)
 # ============================================================
@@ -470,9 +442,6 @@ class TestCLIDeployHelp:
     """deploy --help shows expected options."""
 
     def test_help(self) -> None:
-        from click.testing import CliRunner
-        from wowsim.cli import main
-
         runner = CliRunner()
         result = runner.invoke(main, ["deploy", "--help"])
         assert result.exit_code == 0, result.output
@@ -486,9 +455,6 @@ class TestCLIDeployMissingFaultId:
     """deploy without --fault-id exits with error."""
 
     def test_missing_fault_id(self) -> None:
-        from click.testing import CliRunner
-        from wowsim.cli import main
-
         runner = CliRunner()
         result = runner.invoke(main, ["deploy"])
         assert result.exit_code != 0
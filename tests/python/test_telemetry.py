@@ -0,0 +1,79 @@
+"""Tests for wowsim.telemetry — columnar telemetry views."""
+
+from __future__ import annotations
+
+import pytest
+
+from wowsim.models import TelemetryEntry
+from wowsim.telemetry import TelemetryColumns, extract_tick_columns
+
+
+# ============================================================
+# Group A: Column Extraction (5 tests)
+# ============================================================
+
+
+class TestTelemetryColumnsFromEntries:
+    """TelemetryColumns.from_entries extracts tick and damage columns."""
+
+    def test_tick_columns(self, health_log_entries: list[TelemetryEntry]) -> None:
+        cols = TelemetryColumns.from_entries(health_log_entries)
+        assert cols.tick_durations == [3.0, 4.0, 60.0, 3.5, 4.5]
+        assert cols.tick_overruns == [False, False, True, False, False]
+
+    def test_damage_columns(
+        self, game_mechanic_entries: list[TelemetryEntry]
+    ) -> None:
+        cols = TelemetryColumns.from_entries(game_mechanic_entries)
+        assert cols.damage_attacker_ids == [1, 1, 2]
+        assert cols.damage_amounts == [500, 300, 200]
+        assert cols.damage_attackers == {1, 2}
+        assert cols.kills == 1
+        assert cols.duration_seconds == pytest.approx(0.9)
+
+    def test_empty_entries(self) -> None:
+        cols = TelemetryColumns.from_entries([])
+        assert cols.tick_durations == []
+        assert cols.damage_amounts == []
+        assert cols.kills == 0
+        assert cols.duration_seconds == 0.0
+
+
+class TestExtractTickColumns:
+    """extract_tick_columns returns only game_loop tick metric columns."""
+
+    def test_tick_only(self, health_log_entries: list[TelemetryEntry]) -> None:
+        durations, overruns = extract_tick_columns(health_log_entries)
+        assert durations == [3.0, 4.0, 60.0, 3.5, 4.5]
+        assert overruns == [False, False, True, False, False]
+
+    def test_no_ticks(self, game_mechanic_entries: list[TelemetryEntry]) -> None:
+        assert extract_tick_columns(game_mechanic_entries) == ([], [])
+
+
+# ============================================================
+# Group B: Aggregators Accept Columns (2 tests)
+# ============================================================
+
+
+class TestAggregatorsAcceptColumns:
+    """Aggregators give identical results for entries and prebuilt columns."""
+
+    def test_compute_tick_health(
+        self, health_log_entries: list[TelemetryEntry]
+    ) -> None:
+        from wowsim.health_check import compute_tick_health
+
+        cols = TelemetryColumns.from_entries(health_log_entries)
+        assert compute_tick_health(cols) == compute_tick_health(health_log_entries)
+
+    def test_combat_metrics(
+        self, game_mechanic_entries: list[TelemetryEntry]
+    ) -> None:
+        from wowsim.game_metrics import aggregate_combat_metrics, compute_entity_dps
+
+        cols = TelemetryColumns.from_entries(game_mechanic_entries)
+        assert aggregate_combat_metrics(cols) == aggregate_combat_metrics(
+            game_mechanic_entries
+        )
+        assert compute_entity_dps(cols) == compute_entity_dps(game_mechanic_entries)
@@ -8,17 +8,28 @@ pass/fail evaluation against configurable thresholds.
 from __future__ import annotations
 
 import math
+import operator
+import os
 import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
 
+from wowsim.health_check import compute_tick_health
+from wowsim.log_parser import parse_records
 from wowsim.models import (
     BenchmarkConfig,
     BenchmarkResult,
+    ClientConfig,
     PercentileStats,
     ScenarioResult,
     SpawnResult,
     TelemetryEntry,
+    TelemetryRecord,
     TickHealth,
 )
+from wowsim.telemetry import TelemetryColumns, extract_tick_columns
 
 
 # ---------------------------------------------------------------------------
@@ -26,42 +37,76 @@ from wowsim.models import (
 # ---------------------------------------------------------------------------
 
 
-def compute_percentiles(entries: list[TelemetryEntry]) -> PercentileStats | None:
+def compute_percentiles(
+    entries: list[TelemetryEntry] | TelemetryColumns,
+) -> PercentileStats | None:
     """Compute P50/P95/P99 and jitter from tick duration metrics.
 
-    Uses nearest-rank percentile method. Returns None if no tick
-    metrics are found in the entries.
+    Uses nearest-rank percentile method. Accepts raw entries or a prebuilt
+    TelemetryColumns view. Returns None if no tick metrics are found.
     """
-    durations = [
-        e.data.get("duration_ms", 0.0)
-        for e in entries
-        if e.type == "metric"
-        and e.component == "game_loop"
-        and e.message == "Tick completed"
-    ]
+    if isinstance(entries, TelemetryColumns):
+        durations = entries.tick_durations
+    else:
+        durations = [
+            e.data.get("duration_ms", 0.0)
+            for e in entries
+            if e.type == "metric"
+            and e.component == "game_loop"
+            and e.message == "Tick completed"
+        ]
     if not durations:
         return None
+    return _percentiles_from_durations(durations)
+
+
+_PERCENTILE_RANKS = (50.0, 95.0, 99.0)
 
-    durations.sort()
-    n = len(durations)
 
-    def _percentile(pct: float) -> float:
-        """Nearest-rank percentile."""
-        rank = math.ceil(pct / 100.0 * n)
-        return durations[min(rank, n) - 1]
+def _percentiles_from_durations(durations: list[float]) -> PercentileStats:
+    """Nearest-rank P50/P95/P99 and population jitter from a single sort.
+
+    All three ranks index the same sorted list, and jitter is one
+    deviation pass reduced with ``map(operator.mul, ...)`` rather than a
+    per-element ``** 2`` generator.
+    """
+    ordered = sorted(durations)
+    n = len(ordered)
+    p50, p95, p99 = (
+        ordered[min(math.ceil(pct / 100.0 * n), n) - 1] for pct in _PERCENTILE_RANKS
+    )
 
-    mean = sum(durations) / n
-    variance = sum((d - mean) ** 2 for d in durations) / n
-    jitter = math.sqrt(variance)
+    mean = sum(ordered) / n
+    devs = [d - mean for d in ordered]
+    jitter = math.sqrt(sum(map(operator.mul, devs, devs)) / n)
 
     return PercentileStats(
-        p50_ms=_percentile(50),
-        p95_ms=_percentile(95),
-        p99_ms=_percentile(99),
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
         jitter_ms=round(jitter, 6),
     )
 
 
+def extract_tick_metrics(
+    entries: list[TelemetryEntry] | TelemetryColumns,
+) -> tuple[TickHealth | None, PercentileStats | None]:
+    """Tick health and percentiles from one scan of the entries.
+
+    The tick columns are extracted once (or taken from a prebuilt
+    TelemetryColumns) and shared by both reductions; each result is None
+    when there are no tick metrics.
+    """
+    if isinstance(entries, TelemetryColumns):
+        cols = entries
+    else:
+        durations, overruns = extract_tick_columns(entries)
+        cols = TelemetryColumns(tick_durations=durations, tick_overruns=overruns)
+    if not cols.tick_durations:
+        return None, None
+    return compute_tick_health(cols), compute_percentiles(cols)
+
+
 def compute_throughput(spawn_result: SpawnResult) -> float:
     """Compute actions per second from a spawn result.
 
@@ -119,16 +164,18 @@ def evaluate_benchmark(
     All scenarios must pass. Summary identifies max passing client count
     or the first failing count.
     """
-    all_passed = all(s.passed for s in scenarios)
-    passing = [s for s in scenarios if s.passed]
-    failing = [s for s in scenarios if not s.passed]
-
-    if all_passed:
-        max_count = max(s.client_count for s in passing) if passing else 0
-        return (True, f"All scenarios passed (max {max_count} clients)")
+    max_passing = 0
+    first_fail: ScenarioResult | None = None
+    for s in scenarios:
+        if s.passed:
+            if s.client_count > max_passing:
+                max_passing = s.client_count
+        elif first_fail is None:
+            first_fail = s
+
+    if first_fail is None:
+        return (True, f"All scenarios passed (max {max_passing} clients)")
 
-    first_fail = failing[0]
-    max_passing = max(s.client_count for s in passing) if passing else 0
     return (
         False,
         f"Failed at {first_fail.client_count} clients "
@@ -154,20 +201,20 @@ def format_scenario_result(result: ScenarioResult) -> str:
 
 def format_benchmark_result(result: BenchmarkResult) -> str:
     """Multi-line benchmark report with header, per-scenario lines, and outcome."""
-    lines: list[str] = []
-    lines.append("=== Benchmark Report ===")
-    lines.append(
+    lines = [
+        "=== Benchmark Report ===",
         f"Clients: {result.config.client_counts}  "
-        f"Duration: {result.config.duration_seconds}s/scenario"
-    )
-    lines.append("")
-    lines.append("Scenarios:")
-    for scenario in result.scenarios:
-        lines.append(f"  {format_scenario_result(scenario)}")
-    lines.append("")
+        f"Duration: {result.config.duration_seconds}s/scenario",
+        "",
+        "Scenarios:",
+    ]
+    lines.extend(f"  {format_scenario_result(s)}" for s in result.scenarios)
     tag = "PASS" if result.overall_passed else "FAIL"
-    lines.append(f"Result: [{tag}] {result.summary_message}")
-    lines.append(f"Total:  {result.total_duration_seconds:.2f}s")
+    lines += (
+        "",
+        f"Result: [{tag}] {result.summary_message}",
+        f"Total:  {result.total_duration_seconds:.2f}s",
+    )
     return "\n".join(lines)
 
 
@@ -179,7 +226,6 @@ def format_benchmark_result(result: BenchmarkResult) -> str:
 def _spawn_clients(config: BenchmarkConfig, count: int) -> SpawnResult:
     """Spawn N mock clients using the benchmark config's settings."""
     from wowsim.mock_client import run_spawn
-    from wowsim.models import ClientConfig
 
     client_config = ClientConfig(
         host=config.game_host,
@@ -190,15 +236,77 @@ def _spawn_clients(config: BenchmarkConfig, count: int) -> SpawnResult:
     return run_spawn(client_config, count)
 
 
-def _read_telemetry(config: BenchmarkConfig) -> list[TelemetryEntry]:
-    """Read recent telemetry entries from the log file."""
-    from pathlib import Path
+def _read_telemetry(tail: _TelemetryTail | None) -> TelemetryColumns:
+    """Read tick and combat columns from the recent telemetry log lines.
+
+    The tail reader lives for one benchmark run, so a scenario only decodes
+    the lines appended since the previous one; the returned view is shared
+    and must be treated as read-only.
+    """
+    if tail is None:
+        return TelemetryColumns()
+    return tail.poll()
+
 
-    from wowsim.health_check import read_recent_entries
+_HEAD_BYTES = 256
+"""Length of the head-of-file fingerprint used to detect a rewritten log."""
 
-    if config.log_file is None:
-        return []
-    return read_recent_entries(Path(config.log_file), max_lines=2000)
+
+@dataclass(slots=True)
+class _TelemetryTail:
+    """Incremental reader over the last ``max_lines`` valid records of a log.
+
+    ``offset`` is the byte position after the last complete line consumed;
+    a partially written final line is left for the next poll. ``head`` holds
+    the first bytes of the consumed region: a log that was replaced, shrank,
+    or was truncated and rewritten (so the head or the newline before
+    ``offset`` no longer matches) is re-read from the start.
+    """
+
+    path: Path
+    max_lines: int = 2000
+    offset: int = 0
+    inode: int = 0
+    head: bytes = b""
+    records: deque[TelemetryRecord] = field(init=False)
+    columns: TelemetryColumns | None = None
+
+    def __post_init__(self) -> None:
+        self.records = deque(maxlen=self.max_lines)
+
+    def _continues(self, f: BinaryIO) -> bool:
+        """Whether the open log still extends the bytes already consumed."""
+        if self.offset == 0:
+            return True
+        st = os.fstat(f.fileno())
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            return False
+        if f.read(len(self.head)) != self.head:
+            return False
+        f.seek(self.offset - 1)
+        return f.read(1) == b"\n"
+
+    def poll(self) -> TelemetryColumns:
+        """Decode newly appended lines and return columns over the window."""
+        with open(self.path, "rb") as f:
+            if not self._continues(f):
+                self.offset, self.head = 0, b""
+                self.records.clear()
+                self.columns = None
+            self.inode = os.fstat(f.fileno()).st_ino
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end:
+            if len(self.head) < _HEAD_BYTES:
+                self.head += data[: min(end, _HEAD_BYTES - len(self.head))]
+            self.offset += end
+            lines = data[:end].split(b"\n")[-(self.max_lines + 1) :]
+            self.records.extend(parse_records(lines))
+            self.columns = None
+        if self.columns is None:
+            self.columns = TelemetryColumns.from_records(list(self.records))
+        return self.columns
 
 
 def _settle(seconds: float) -> None:
@@ -217,13 +325,14 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkResult:
     For each client_count:
     1. Spawn clients (skipped for count=0 baseline)
     2. Settle (wait for server to stabilize)
-    3. Read telemetry and compute tick health + percentiles
+    3. Read telemetry and compute tick health + percentiles (reused when
+       the log has not changed since the previous scenario)
     4. Evaluate against thresholds
     """
-    from wowsim.health_check import compute_tick_health
-
     start = time.monotonic()
     scenarios: list[ScenarioResult] = []
+    last_telemetry: TelemetryColumns | list[TelemetryEntry] | None = None
+    tail = _TelemetryTail(Path(config.log_file)) if config.log_file else None
 
     for count in config.client_counts:
         throughput = 0.0
@@ -234,23 +343,25 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkResult:
 
         _settle(config.settle_seconds)
 
-        entries = _read_telemetry(config)
-        tick_health = compute_tick_health(entries)
-        percentiles = compute_percentiles(entries)
-
-        if tick_health is None:
-            tick_health = TickHealth(
-                total_ticks=0,
-                avg_duration_ms=0.0,
-                max_duration_ms=0.0,
-                min_duration_ms=0.0,
-                overrun_count=0,
-                overrun_pct=0.0,
-            )
-        if percentiles is None:
-            percentiles = PercentileStats(
-                p50_ms=0.0, p95_ms=0.0, p99_ms=0.0, jitter_ms=0.0
-            )
+        telemetry = _read_telemetry(tail)
+        # An unchanged log yields the same columns object: reuse its stats.
+        if telemetry is not last_telemetry:
+            last_telemetry = telemetry
+            tick_health, percentiles = extract_tick_metrics(telemetry)
+
+            if tick_health is None:
+                tick_health = TickHealth(
+                    total_ticks=0,
+                    avg_duration_ms=0.0,
+                    max_duration_ms=0.0,
+                    min_duration_ms=0.0,
+                    overrun_count=0,
+                    overrun_pct=0.0,
+                )
+            if percentiles is None:
+                percentiles = PercentileStats(
+                    p50_ms=0.0, p95_ms=0.0, p99_ms=0.0, jitter_ms=0.0
+                )
 
         scenario = evaluate_scenario(
             tick_health, percentiles, throughput, count, config
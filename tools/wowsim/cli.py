@@ -6,23 +6,13 @@ log analysis, mock client spawning, and the monitoring dashboard.
 
 from __future__ import annotations
 
+import re
 import sys
 from pathlib import Path
 
 import click
 
 from wowsim import __version__
-from wowsim.log_parser import (
-    detect_anomalies,
-    filter_entries,
-    format_anomalies,
-    format_game_mechanics,
-    format_summary,
-    parse_file,
-    parse_stream,
-    summarize,
-)
-from wowsim.models import ParseResult
 
 
 @click.group()
@@ -239,10 +229,15 @@ def list_faults(ctx: click.Context) -> None:
     "--component", "component_filter", default=None, help="Filter by component."
 )
 @click.option(
-    "--message", "message_filter", default=None, help="Filter by message substring."
+    "--message",
+    "message_filter",
+    multiple=True,
+    help="Filter by message substring (repeatable; matches any).",
 )
 @click.option("--anomalies", is_flag=True, help="Show detected anomalies only.")
-@click.option("--game-mechanics", is_flag=True, help="Show game mechanic stats (cast/combat/DPS).")
+@click.option(
+    "--game-mechanics", is_flag=True, help="Show game mechanic stats (cast/combat/DPS)."
+)
 @click.option(
     "--format",
     "output_format",
@@ -254,7 +249,7 @@ def parse_logs(
     file: str,
     type_filter: str | None,
     component_filter: str | None,
-    message_filter: str | None,
+    message_filter: tuple[str, ...],
     anomalies: bool,
     game_mechanics: bool,
     output_format: str,
@@ -263,6 +258,18 @@ def parse_logs(
 
     FILE is the path to a JSONL telemetry file (use - for stdin).
     """
+    from wowsim.log_parser import (
+        detect_anomalies,
+        filter_entries,
+        format_anomalies,
+        format_game_mechanics,
+        format_summary,
+        iter_parse_result_json,
+        parse_file,
+        parse_stream,
+        summarize,
+    )
+
     if file == "-":
         entries = parse_stream(sys.stdin)
     else:
@@ -275,27 +282,31 @@ def parse_logs(
         entries,
         type_filter=type_filter,
         component_filter=component_filter,
-        message_filter=message_filter,
+        message_filter=message_filter or None,
     )
 
-    summary = summarize(entries)
-    detected = detect_anomalies(entries)
-
+    # Each view computes only the aggregates it prints.
     if output_format == "json":
-        result = ParseResult(entries=entries, summary=summary, anomalies=detected)
-        click.echo(result.model_dump_json(indent=2))
+        chunks = iter_parse_result_json(
+            entries, summarize(entries), detect_anomalies(entries)
+        )
+        # click.echo flushes on every call; let stdout buffer the chunks.
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
     elif game_mechanics:
         from wowsim.game_metrics import aggregate_game_mechanics
 
         gm_summary = aggregate_game_mechanics(entries)
         click.echo(format_game_mechanics(gm_summary))
     elif anomalies:
-        click.echo(format_anomalies(detected))
+        click.echo(format_anomalies(detect_anomalies(entries)))
     else:
-        click.echo(format_summary(summary))
+        detected = detect_anomalies(entries)
+        sections = [format_summary(summarize(entries))]
         if detected:
-            click.echo("")
-            click.echo(format_anomalies(detected))
+            sections.append(format_anomalies(detected))
+        click.echo("\n\n".join(sections))
 
 
 @main.command("spawn-clients")
@@ -304,6 +315,12 @@ def parse_logs(
 @click.option("--host", default="localhost", help="Game server host.")
 @click.option("--port", default=8080, type=int, help="Game server port.")
 @click.option("--rate", default=2.0, type=float, help="Actions per second per client.")
+@click.option(
+    "--max-connects",
+    default=256,
+    type=click.IntRange(min=1),
+    help="Max concurrent TCP connection attempts.",
+)
 @click.option(
     "--format",
     "output_format",
@@ -317,6 +334,7 @@ def spawn_clients(
     host: str,
     port: int,
     rate: float,
+    max_connects: int,
     output_format: str,
 ) -> None:
     """Spawn simulated player clients that generate game traffic."""
@@ -328,6 +346,7 @@ def spawn_clients(
         port=port,
         actions_per_second=rate,
         duration_seconds=duration,
+        max_concurrent_connects=max_connects,
     )
     result = run_spawn(config, count)
 
@@ -347,9 +366,7 @@ def spawn_clients(
 @click.option("--host", default="localhost", help="Game server host.")
 @click.option("--port", default=8080, type=int, help="Game server port.")
 @click.option("--control-port", default=8081, type=int, help="Control channel port.")
-@click.option(
-    "--refresh", default=2.0, type=float, help="Refresh interval in seconds."
-)
+@click.option("--refresh", default=2.0, type=float, help="Refresh interval in seconds.")
 def dashboard(
     log_file: str,
     host: str,
@@ -472,6 +489,10 @@ def deploy(
         click.echo(format_pipeline_result(result))
 
 
+_COUNTS_RE = re.compile(r"\s*\d+\s*(?:,\s*\d+\s*)*")
+"""``--counts`` syntax: comma-separated non-negative integers."""
+
+
 @main.command()
 @click.option(
     "--log-file",
@@ -524,7 +545,13 @@ def benchmark(
     from wowsim.benchmark import format_benchmark_result, run_benchmark
     from wowsim.models import BenchmarkConfig
 
-    client_counts = [int(c.strip()) for c in counts.split(",")]
+    if _COUNTS_RE.fullmatch(counts) is None:
+        raise click.BadParameter(
+            f"expected comma-separated integers, got {counts!r}",
+            param_hint="'--counts'",
+        )
+    # int() ignores the surrounding whitespace the pattern allows.
+    client_counts = list(map(int, counts.split(",")))
 
     config = BenchmarkConfig(
         game_host=host,
@@ -548,7 +548,9 @@ try:
             """Handle duration picker result — start spawn with chosen duration."""
             if duration is None:
                 return
-            self._spawn_stop_event = threading.Event()
+            from wowsim.mock_client import ThreadStopEvent
+
+            self._spawn_stop_event = ThreadStopEvent()
             self._spawn_active = True
             self._update_suggestion()
             label = "persistent" if duration == float("inf") else f"{duration:.0f}s"
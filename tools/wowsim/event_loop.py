@@ -0,0 +1,21 @@
+"""Event loop selection for the socket-heavy asyncio entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+
+def fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Return uvloop's loop constructor, or asyncio's when uvloop isn't installed.
+
+    uvloop is an optional dependency (the ``fast`` extra); its libuv-based
+    transports speed up the many-socket spawn_clients path. Pass the result
+    as ``loop_factory`` to ``asyncio.Runner`` rather than installing a
+    process-wide event loop policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop
+    return uvloop.new_event_loop
@@ -7,7 +7,11 @@ for CLI use, and duration parsing utilities.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import json
+import re
+import threading
 from typing import Any
 
 from wowsim.models import (
@@ -23,11 +27,19 @@ from wowsim.models import (
 TICKS_PER_SECOND: int = 20
 """WoW server tick rate (matching C++ game loop at 20 Hz)."""
 
+COMMAND_TIMEOUT_SEC: float = 5.0
+"""Longest a command waits for the server's reply before failing."""
+
 
 class ControlClientError(Exception):
     """Raised on error responses or connection failures."""
 
 
+_DURATION_RE = re.compile(r"(\d+(?:\.\d*)?|\.\d+)([st])")
+"""Number followed by a unit suffix: 's' (seconds) or 't' (ticks)."""
+
+
+@functools.lru_cache(maxsize=64)
 def parse_duration(duration_str: str) -> int:
     """Parse a human-friendly duration string into server ticks.
 
@@ -42,28 +54,21 @@ def parse_duration(duration_str: str) -> int:
     if not duration_str:
         raise ValueError("Empty duration string")
 
-    if duration_str.endswith("s"):
-        try:
-            seconds = float(duration_str[:-1])
-        except ValueError:
-            raise ValueError(
-                f"Invalid duration: {duration_str!r} — expected number before 's'"
-            )
-        return int(seconds * TICKS_PER_SECOND)
-
-    if duration_str.endswith("t"):
-        try:
-            ticks = int(duration_str[:-1])
-        except ValueError:
-            raise ValueError(
-                f"Invalid duration: {duration_str!r} — expected integer before 't'"
-            )
-        return ticks
-
-    raise ValueError(
-        f"Invalid duration: {duration_str!r}"
-        " — must end with 's' (seconds) or 't' (ticks)"
-    )
+    m = _DURATION_RE.fullmatch(duration_str)
+    if m is None:
+        raise ValueError(
+            f"Invalid duration: {duration_str!r}"
+            " — must be a number ending with 's' (seconds) or 't' (ticks)"
+        )
+
+    value, unit = m.groups()
+    if unit == "s":
+        return int(float(value) * TICKS_PER_SECOND)
+    if "." in value:
+        raise ValueError(
+            f"Invalid duration: {duration_str!r} — expected integer before 't'"
+        )
+    return int(value)
 
 
 # ---------------------------------------------------------------------------
@@ -116,9 +121,16 @@ class ControlClient:
 
         payload = json.dumps(request) + "\n"
         self._writer.write(payload.encode())
-        await self._writer.drain()
-
-        line = await self._reader.readline()
+        try:
+            # Sync wrappers share one event loop across threads: a server
+            # that never answers must not hold it indefinitely.
+            async with asyncio.timeout(COMMAND_TIMEOUT_SEC):
+                await self._writer.drain()
+                line = await self._reader.readline()
+        except TimeoutError:
+            raise ControlClientError(
+                f"No response within {COMMAND_TIMEOUT_SEC}s"
+            ) from None
         if not line:
             raise ControlClientError("Connection closed by server")
 
@@ -136,11 +148,14 @@ class ControlClient:
         duration_ticks: int = 0,
     ) -> ControlResponse:
         """Activate a fault on the server."""
+        # Leave the model's own empty default alone when there is nothing
+        # to send, instead of validating a throwaway dict.
+        extra = {"params": params} if params else {}
         req = FaultActivateRequest(
             fault_id=fault_id,
-            params=params or {},
             target_zone_id=target_zone_id,
             duration_ticks=duration_ticks,
+            **extra,
         )
         return await self._send_command(req.model_dump())
 
@@ -170,14 +185,49 @@ class ControlClient:
 # ---------------------------------------------------------------------------
 
 
+_runner: asyncio.Runner | None = None
+_runner_lock = threading.Lock()
+"""Guards ``_runner``: one event loop cannot be driven from two threads at
+once, and the dashboard issues commands from worker threads."""
+
+
+def _get_runner() -> asyncio.Runner:
+    """Return the process-wide asyncio.Runner, creating it on first use.
+
+    Callers must hold ``_runner_lock`` while running on it.
+    """
+    global _runner
+    if _runner is None:
+        # A loop_factory keeps the Runner from installing its loop as the
+        # creating thread's current event loop.
+        _runner = asyncio.Runner(loop_factory=asyncio.new_event_loop)
+        atexit.register(_close_runner)
+    return _runner
+
+
+def _close_runner() -> None:
+    """Close the shared event loop."""
+    global _runner
+    with _runner_lock:
+        if _runner is not None:
+            _runner.close()
+            _runner = None
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine to completion on the shared event loop."""
+    with _runner_lock:
+        return _get_runner().run(coro)
+
+
 def _run_command(host: str, port: int, coro_factory: Any) -> ControlResponse:
-    """Run an async command in a fresh event loop."""
+    """Run an async command on the shared event loop."""
 
     async def _run() -> ControlResponse:
         async with ControlClient(host, port) as client:
             return await coro_factory(client)
 
-    return asyncio.run(_run())
+    return _run_sync(_run())
 
 
 def activate_fault(
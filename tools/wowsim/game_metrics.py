@@ -2,7 +2,8 @@
 
 Pure functions that compute cast metrics, combat metrics, and per-entity DPS
 from telemetry entries. No I/O — takes lists of TelemetryEntry and returns
-Pydantic models.
+Pydantic models. Results are computed locally from already-validated
+entries, so they are built with ``model_construct`` to skip re-validation.
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from wowsim.models import (
     GameMechanicSummary,
     TelemetryEntry,
 )
+from wowsim.telemetry import TelemetryColumns
 
 
 def _compute_duration_seconds(entries: list[TelemetryEntry]) -> float:
@@ -56,7 +58,7 @@ def aggregate_cast_metrics(
     gcd_block_rate = gcd_blocked / total_attempts if total_attempts > 0 else 0.0
     cast_rate_per_sec = started / duration_seconds if duration_seconds > 0 else 0.0
 
-    return CastMetrics(
+    return CastMetrics.model_construct(
         casts_started=started,
         casts_completed=completed,
         casts_interrupted=interrupted,
@@ -67,30 +69,35 @@ def aggregate_cast_metrics(
     )
 
 
+def _as_columns(entries: list[TelemetryEntry] | TelemetryColumns) -> TelemetryColumns:
+    """Return entries as a TelemetryColumns view, building one if needed."""
+    if isinstance(entries, TelemetryColumns):
+        return entries
+    return TelemetryColumns.from_entries(entries)
+
+
 def compute_entity_dps(
-    entries: list[TelemetryEntry],
+    entries: list[TelemetryEntry] | TelemetryColumns,
     duration_seconds: float | None = None,
 ) -> list[EntityDPS]:
     """Compute per-entity damage stats, sorted descending by total_damage."""
+    cols = _as_columns(entries)
     damage_by_entity: dict[int, int] = defaultdict(int)
     attacks_by_entity: dict[int, int] = defaultdict(int)
 
-    for e in entries:
-        if e.component == "combat" and e.message == "Damage dealt":
-            attacker_id = e.data.get("attacker_id", 0)
-            damage = e.data.get("actual_damage", 0)
-            damage_by_entity[attacker_id] += damage
-            attacks_by_entity[attacker_id] += 1
+    for attacker_id, damage in zip(cols.damage_attacker_ids, cols.damage_amounts):
+        damage_by_entity[attacker_id] += damage
+        attacks_by_entity[attacker_id] += 1
 
     if duration_seconds is None:
-        duration_seconds = _compute_duration_seconds(entries)
+        duration_seconds = cols.duration_seconds
 
     result: list[EntityDPS] = []
     for entity_id in damage_by_entity:
         total = damage_by_entity[entity_id]
         dps = total / duration_seconds if duration_seconds > 0 else 0.0
         result.append(
-            EntityDPS(
+            EntityDPS.model_construct(
                 entity_id=entity_id,
                 total_damage=total,
                 dps=dps,
@@ -103,35 +110,23 @@ def compute_entity_dps(
 
 
 def aggregate_combat_metrics(
-    entries: list[TelemetryEntry],
+    entries: list[TelemetryEntry] | TelemetryColumns,
     duration_seconds: float | None = None,
 ) -> CombatMetrics:
     """Aggregate combat statistics from combat telemetry events."""
-    total_damage = 0
-    total_attacks = 0
-    kills = 0
-    attacker_ids: set[int] = set()
-
-    for e in entries:
-        if e.component != "combat":
-            continue
-        if e.message == "Damage dealt":
-            total_damage += e.data.get("actual_damage", 0)
-            total_attacks += 1
-            attacker_ids.add(e.data.get("attacker_id", 0))
-        elif e.message == "Entity killed":
-            kills += 1
+    cols = _as_columns(entries)
+    total_damage = sum(cols.damage_amounts)
 
     if duration_seconds is None:
-        duration_seconds = _compute_duration_seconds(entries)
+        duration_seconds = cols.duration_seconds
 
     overall_dps = total_damage / duration_seconds if duration_seconds > 0 else 0.0
 
-    return CombatMetrics(
+    return CombatMetrics.model_construct(
         total_damage=total_damage,
-        total_attacks=total_attacks,
-        kills=kills,
-        active_entities=len(attacker_ids),
+        total_attacks=len(cols.damage_amounts),
+        kills=cols.kills,
+        active_entities=len(cols.damage_attackers),
         overall_dps=overall_dps,
     )
 
@@ -141,11 +136,12 @@ def aggregate_game_mechanics(
     top_n: int = 5,
 ) -> GameMechanicSummary:
     """Orchestrate all game-mechanic aggregations into a single summary."""
-    duration = _compute_duration_seconds(entries)
+    cols = TelemetryColumns.from_entries(entries)
+    duration = cols.duration_seconds
 
     cast = aggregate_cast_metrics(entries, duration_seconds=duration)
-    entity_dps = compute_entity_dps(entries, duration_seconds=duration)
-    combat = aggregate_combat_metrics(entries, duration_seconds=duration)
+    entity_dps = compute_entity_dps(cols, duration_seconds=duration)
+    combat = aggregate_combat_metrics(cols, duration_seconds=duration)
 
     return GameMechanicSummary(
         cast_metrics=cast,
@@ -7,8 +7,10 @@ counts, and anomaly detection.
 
 from __future__ import annotations
 
+import functools
 import socket
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -22,49 +24,77 @@ from wowsim.models import (
     TickHealth,
     ZoneHealthSummary,
 )
+from wowsim.telemetry import TelemetryColumns, extract_tick_columns
 
 # ---------------------------------------------------------------------------
 # Core computation (pure functions on TelemetryEntry lists)
 # ---------------------------------------------------------------------------
 
 
-def compute_tick_health(entries: list[TelemetryEntry]) -> TickHealth | None:
+def compute_tick_health(
+    entries: list[TelemetryEntry] | TelemetryColumns,
+) -> TickHealth | None:
     """Extract tick rate stats from game_loop 'Tick completed' metrics.
 
-    Returns None if no tick metrics are found in the entries.
+    Accepts raw entries or a prebuilt TelemetryColumns view. Returns None
+    if no tick metrics are found.
     """
-    tick_entries = [
-        e
-        for e in entries
-        if e.type == "metric"
-        and e.component == "game_loop"
-        and e.message == "Tick completed"
-    ]
-    if not tick_entries:
+    if isinstance(entries, TelemetryColumns):
+        durations, overrun_flags = entries.tick_durations, entries.tick_overruns
+    else:
+        durations, overrun_flags = extract_tick_columns(entries)
+    return _tick_health_from_columns(durations, overrun_flags)
+
+
+def _tick_health_from_columns(
+    durations: list[float], overrun_flags: list[bool]
+) -> TickHealth | None:
+    """Reduce tick duration/overrun columns to a TickHealth, or None if empty."""
+    if not durations:
         return None
 
-    durations = [e.data.get("duration_ms", 0.0) for e in tick_entries]
-    overruns = sum(1 for e in tick_entries if e.data.get("overrun", False))
-    total = len(tick_entries)
+    # Each statistic is one C-level reduction over a flat column.
+    overruns = sum(overrun_flags)
+    total = len(durations)
 
-    return TickHealth(
+    # Values are derived from already-validated entries — skip re-validation.
+    return TickHealth.model_construct(
         total_ticks=total,
         avg_duration_ms=sum(durations) / total,
-        max_duration_ms=max(durations),
-        min_duration_ms=min(durations),
+        max_duration_ms=float(max(durations)),
+        min_duration_ms=float(min(durations)),
         overrun_count=overruns,
         overrun_pct=(overruns / total) * 100.0,
     )
 
 
+@dataclass(slots=True)
+class _ZoneAccumulator:
+    """Running per-zone totals; one dict lookup per zone entry reaches all."""
+
+    tick_count: int = 0
+    tick_duration_total: float = 0.0
+    errors: int = 0
+    casts: int = 0
+    damage: int = 0
+    first_ts: datetime | None = None
+    last_ts: datetime | None = None
+
+    def add_tick(self, entry: TelemetryEntry) -> None:
+        data = entry.data
+        self.tick_count += 1
+        self.tick_duration_total += data.get("duration_ms", 0.0)
+        self.casts += data.get("casts_started", 0)
+        self.damage += data.get("total_damage_dealt", 0)
+        # Keep the datetimes; only the final span is converted to seconds.
+        if self.first_ts is None:
+            self.first_ts = entry.timestamp
+        self.last_ts = entry.timestamp
+
+
 def compute_zone_health(entries: list[TelemetryEntry]) -> list[ZoneHealthSummary]:
     """Extract per-zone health from zone tick metrics and zone errors."""
-    zone_ticks: dict[int, list[float]] = defaultdict(list)
-    zone_errors: dict[int, int] = defaultdict(int)
-    zone_casts: dict[int, int] = defaultdict(int)
-    zone_damage: dict[int, int] = defaultdict(int)
-    zone_first_ts: dict[int, float] = {}
-    zone_last_ts: dict[int, float] = {}
+    zones: dict[int, _ZoneAccumulator] = defaultdict(_ZoneAccumulator)
 
     for entry in entries:
         if (
@@ -72,55 +102,43 @@ def compute_zone_health(entries: list[TelemetryEntry]) -> list[ZoneHealthSummary
             and entry.component == "zone"
             and entry.message == "Zone tick completed"
         ):
-            zone_id = entry.data.get("zone_id", 0)
-            duration = entry.data.get("duration_ms", 0.0)
-            zone_ticks[zone_id].append(duration)
-            zone_casts[zone_id] += entry.data.get("casts_started", 0)
-            zone_damage[zone_id] += entry.data.get("total_damage_dealt", 0)
-            ts = entry.timestamp.timestamp()
-            if zone_id not in zone_first_ts:
-                zone_first_ts[zone_id] = ts
-            zone_last_ts[zone_id] = ts
+            zones[entry.data.get("zone_id", 0)].add_tick(entry)
         elif (
             entry.type == "error"
             and entry.component == "zone"
             and entry.message == "Zone tick exception"
         ):
-            zone_id = entry.data.get("zone_id", 0)
-            zone_errors[zone_id] += 1
+            zones[entry.data.get("zone_id", 0)].errors += 1
 
-    all_zone_ids = set(zone_ticks.keys()) | set(zone_errors.keys())
-    summaries: list[ZoneHealthSummary] = []
+    return _summarize_zones(zones)
 
-    for zone_id in sorted(all_zone_ids):
-        ticks = zone_ticks.get(zone_id, [])
-        errors = zone_errors.get(zone_id, 0)
 
-        if errors > 0:
-            state = "CRASHED"
-        else:
-            state = "ACTIVE"
+def _summarize_zones(
+    zones: dict[int, _ZoneAccumulator],
+) -> list[ZoneHealthSummary]:
+    """Build per-zone summaries, sorted by zone ID, from accumulated zone stats."""
+    summaries: list[ZoneHealthSummary] = []
 
-        avg_duration = sum(ticks) / len(ticks) if ticks else 0.0
+    for zone_id in sorted(zones):
+        z = zones[zone_id]
+        state = "CRASHED" if z.errors > 0 else "ACTIVE"
+        avg_duration = z.tick_duration_total / z.tick_count if z.tick_count else 0.0
 
-        total_casts = zone_casts.get(zone_id, 0)
-        total_damage = zone_damage.get(zone_id, 0)
-        first_ts = zone_first_ts.get(zone_id)
-        last_ts = zone_last_ts.get(zone_id)
+        first_ts, last_ts = z.first_ts, z.last_ts
         if first_ts is not None and last_ts is not None and last_ts > first_ts:
-            zone_dps = total_damage / (last_ts - first_ts)
+            zone_dps = z.damage / (last_ts - first_ts).total_seconds()
         else:
-            zone_dps = float(total_damage) if total_damage > 0 else 0.0
+            zone_dps = float(z.damage) if z.damage > 0 else 0.0
 
         summaries.append(
             ZoneHealthSummary(
                 zone_id=zone_id,
                 state=state,
-                tick_count=len(ticks),
-                error_count=errors,
+                tick_count=z.tick_count,
+                error_count=z.errors,
                 avg_tick_duration_ms=avg_duration,
-                total_casts=total_casts,
-                total_damage=total_damage,
+                total_casts=z.casts,
+                total_damage=z.damage,
                 zone_dps=zone_dps,
             )
         )
@@ -130,15 +148,50 @@ def compute_zone_health(entries: list[TelemetryEntry]) -> list[ZoneHealthSummary
 
 def estimate_player_count(entries: list[TelemetryEntry]) -> int:
     """Net player count = connections accepted - disconnections."""
+    # One C-level Counter fold over game_server event messages; the two
+    # counts are then plain lookups.
+    counts = Counter(
+        e.message
+        for e in entries
+        if e.component == "game_server" and e.type == "event"
+    )
+    return max(0, counts["Connection accepted"] - counts["Client disconnected"])
+
+
+def compute_all_health(
+    entries: list[TelemetryEntry],
+) -> tuple[TickHealth | None, list[ZoneHealthSummary], int]:
+    """Compute tick health, zone health, and player count in one pass.
+
+    Equivalent to calling compute_tick_health, compute_zone_health, and
+    estimate_player_count separately, but walks the entry list once and
+    dispatches on component to update every accumulator inline.
+    """
+    durations: list[float] = []
+    overrun_flags: list[bool] = []
+    zones: dict[int, _ZoneAccumulator] = defaultdict(_ZoneAccumulator)
     connections = 0
     disconnections = 0
+
     for entry in entries:
-        if entry.type == "event" and entry.component == "game_server":
+        component = entry.component
+        if component == "game_loop":
+            if entry.type == "metric" and entry.message == "Tick completed":
+                durations.append(entry.data.get("duration_ms", 0.0))
+                overrun_flags.append(bool(entry.data.get("overrun", False)))
+        elif component == "zone":
+            if entry.type == "metric" and entry.message == "Zone tick completed":
+                zones[entry.data.get("zone_id", 0)].add_tick(entry)
+            elif entry.type == "error" and entry.message == "Zone tick exception":
+                zones[entry.data.get("zone_id", 0)].errors += 1
+        elif component == "game_server" and entry.type == "event":
             if entry.message == "Connection accepted":
                 connections += 1
             elif entry.message == "Client disconnected":
                 disconnections += 1
-    return max(0, connections - disconnections)
+
+    tick = _tick_health_from_columns(durations, overrun_flags)
+    return tick, _summarize_zones(zones), max(0, connections - disconnections)
 
 
 def determine_status(
@@ -149,31 +202,30 @@ def determine_status(
     connected_players: int = 0,
 ) -> str:
     """Determine overall health status: 'healthy', 'degraded', or 'critical'."""
+    severities = {a.severity for a in anomalies}
+    states = {z.state for z in zones}
+
     # Critical: any critical anomaly OR any CRASHED zone
-    if any(a.severity == "critical" for a in anomalies):
-        return "critical"
-    if any(z.state == "CRASHED" for z in zones):
+    if "critical" in severities or "CRASHED" in states:
         return "critical"
 
     # Degraded: any warning anomaly OR any DEGRADED zone OR overrun_pct > 10%
-    if any(a.severity == "warning" for a in anomalies):
-        return "degraded"
-    if any(z.state == "DEGRADED" for z in zones):
+    if "warning" in severities or "DEGRADED" in states:
         return "degraded"
     if tick is not None and tick.overrun_pct > 10.0:
         return "degraded"
 
     # Degraded: game-mechanic signals
     if game_mechanics is not None:
-        gm = game_mechanics
-        if gm.cast_metrics.gcd_block_rate > 0.5:
+        c = game_mechanics.cast_metrics
+        if c.gcd_block_rate > 0.5:
             return "degraded"
-        if gm.cast_metrics.casts_started > 0 and gm.cast_metrics.cast_success_rate < 0.5:
+        if c.casts_started > 0 and c.cast_success_rate < 0.5:
             return "degraded"
         if (
             connected_players > 0
-            and gm.combat_metrics.total_attacks == 0
-            and gm.cast_metrics.casts_started == 0
+            and game_mechanics.combat_metrics.total_attacks == 0
+            and c.casts_started == 0
         ):
             return "degraded"
 
@@ -216,6 +268,49 @@ def read_recent_entries(
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, slots=True)
+class _LogAnalysis:
+    """Everything build_health_report derives from the telemetry log."""
+
+    tick: TickHealth | None
+    zones: tuple[ZoneHealthSummary, ...]
+    players: int
+    anomalies: tuple[Anomaly, ...]
+    error_count: int
+    game_mechanics: GameMechanicSummary | None
+
+
+@functools.lru_cache(maxsize=8)
+def _analyze_log(log_path: str, mtime_ns: int, size: int) -> _LogAnalysis:
+    """Analyze a log's recent entries; the stat fields only key the cache.
+
+    Watch mode and canary polls rebuild the report every few seconds, so
+    an unchanged log is parsed once and only the network probes rerun.
+    """
+    return _analyze_entries(read_recent_entries(Path(log_path)))
+
+
+def _analyze_entries(entries: list[TelemetryEntry]) -> _LogAnalysis:
+    """Tick/zone/player health, anomalies, errors and game mechanics."""
+    tick, zones, players = compute_all_health(entries)
+
+    # Game-mechanic aggregation
+    game_mechanics: GameMechanicSummary | None = None
+    if entries:
+        from wowsim.game_metrics import aggregate_game_mechanics
+
+        game_mechanics = aggregate_game_mechanics(entries)
+
+    return _LogAnalysis(
+        tick=tick,
+        zones=tuple(zones),
+        players=players,
+        anomalies=tuple(detect_anomalies(entries)),
+        error_count=sum(1 for e in entries if e.type == "error"),
+        game_mechanics=game_mechanics,
+    )
+
+
 def build_health_report(
     log_path: Path | None = None,
     game_host: str = "localhost",
@@ -224,27 +319,23 @@ def build_health_report(
     control_port: int = 8081,
     skip_faults: bool = False,
 ) -> HealthReport:
-    """Build a complete health report from log file + server check + fault query."""
+    """Build a complete health report from log file + server check + fault query.
+
+    Reachability probes the control port only: a game-port probe would show
+    up in the telemetry log as a connect/disconnect pair, changing the log
+    on every refresh. The log analysis is reused while the log's mtime and
+    size are unchanged.
+    """
     reachable = check_server_reachable(control_host, control_port)
 
-    entries: list[TelemetryEntry] = []
-    if log_path is not None:
-        entries = read_recent_entries(log_path)
-
-    tick = compute_tick_health(entries)
-    zones = compute_zone_health(entries)
-    players = estimate_player_count(entries)
-    anomalies = detect_anomalies(entries)
-    error_count = sum(1 for e in entries if e.type == "error")
+    if log_path is None:
+        log = _analyze_entries([])
+    else:
+        st = log_path.stat()
+        log = _analyze_log(str(log_path), st.st_mtime_ns, st.st_size)
+    tick, players, game_mechanics = log.tick, log.players, log.game_mechanics
     uptime_ticks = tick.total_ticks if tick else 0
 
-    # Game-mechanic aggregation
-    game_mechanics: GameMechanicSummary | None = None
-    if entries:
-        from wowsim.game_metrics import aggregate_game_mechanics
-
-        game_mechanics = aggregate_game_mechanics(entries)
-
     active_faults: list[FaultInfo] = []
     if not skip_faults:
         try:
@@ -256,6 +347,7 @@ def build_health_report(
         except (OSError, Exception):
             pass
 
+    zones, anomalies = list(log.zones), list(log.anomalies)
     status = determine_status(
         tick, zones, anomalies,
         game_mechanics=game_mechanics,
@@ -271,7 +363,7 @@ def build_health_report(
         connected_players=players,
         anomalies=anomalies,
         active_faults=active_faults,
-        error_count=error_count,
+        error_count=log.error_count,
         uptime_ticks=uptime_ticks,
         game_mechanics=game_mechanics,
     )
@@ -5,14 +5,24 @@ Parsing, filtering, summarizing, and anomaly detection.
 
 from __future__ import annotations
 
-import json
+import functools
+import mmap
+import re
 from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from datetime import timedelta
 from pathlib import Path
 from typing import TextIO
 
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from wowsim.models import Anomaly, GameMechanicSummary, LogSummary, TelemetryEntry
+from wowsim.models import (
+    Anomaly,
+    GameMechanicSummary,
+    LogSummary,
+    TelemetryEntry,
+    TelemetryRecord,
+)
 
 # --- Anomaly detection thresholds ---
 DEFAULT_TICK_DURATION_WARN_MS = 60.0
@@ -20,23 +30,123 @@ DEFAULT_TICK_DURATION_CRIT_MS = 100.0
 DEFAULT_ERROR_BURST_THRESHOLD = 5
 DEFAULT_ERROR_BURST_WINDOW_SEC = 10.0
 
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
-def parse_line(line: str) -> TelemetryEntry | None:
+
+# Bound once at import: calling the compiled pydantic-core validator directly
+# skips model_validate_json's per-call Python wrapper on the per-line path.
+_decode_entry = TelemetryEntry.__pydantic_validator__.validate_json
+
+_OBJECT_START = ("{", b"{")
+
+
+def parse_line(line: str | bytes) -> TelemetryEntry | None:
     """Parse a single JSON telemetry line into a TelemetryEntry, or None if invalid."""
     line = line.strip()
-    if not line:
+    # Every entry is a JSON object: reject blank/garbage lines without
+    # invoking the decoder.
+    if line[:1] not in _OBJECT_START:
         return None
     try:
-        raw = json.loads(line)
-        return TelemetryEntry.model_validate(raw)
-    except (json.JSONDecodeError, ValidationError):
+        # pydantic-core decodes straight into the model (no interim dict);
+        # malformed JSON surfaces as a ValidationError too.
+        return _decode_entry(line)
+    except ValidationError:
         return None
 
 
+_ENTRY_LIST_ADAPTER: TypeAdapter[list[TelemetryEntry]] = TypeAdapter(
+    list[TelemetryEntry]
+)
+
+
 def parse_file(path: Path) -> list[TelemetryEntry]:
-    """Parse all valid telemetry entries from a JSONL file."""
-    with open(path) as f:
-        return parse_stream(f)
+    """Parse all valid telemetry entries from a JSONL file.
+
+    The file is memory-mapped and split into byte lines without copying it
+    into one large buffer first. The common all-valid file is validated as
+    one JSON array in a single pydantic-core call; if any line is bad, falls
+    back to per-line parsing so that only the invalid lines are dropped.
+    An unterminated last line (often a write still in progress) is parsed
+    on its own, so it cannot push the rest of the file onto the slow path.
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            # mmap rejects zero-length files.
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = list(iter(mm.readline, b""))
+    tail = None if lines[-1].endswith(b"\n") else parse_line(lines.pop())
+    entries = _parse_lines(lines)
+    if tail is not None:
+        entries.append(tail)
+    return entries
+
+
+_RECORD_ADAPTER: TypeAdapter[TelemetryRecord] = TypeAdapter(TelemetryRecord)
+_RECORD_LIST_ADAPTER: TypeAdapter[list[TelemetryRecord]] = TypeAdapter(
+    list[TelemetryRecord]
+)
+
+
+def parse_records(lines: Sequence[bytes]) -> list[TelemetryRecord]:
+    """Validate JSONL byte lines as TelemetryRecord dicts, dropping bad lines.
+
+    Like _parse_lines, the all-valid case is one JSON-array validation call,
+    with a per-line fallback when any line fails.
+    """
+    objects = _object_lines(lines)
+    try:
+        records = _RECORD_LIST_ADAPTER.validate_json(_join_array(objects))
+    except ValidationError:
+        pass
+    else:
+        if len(records) == len(objects):
+            return records
+    records = []
+    for line in objects:
+        try:
+            records.append(_RECORD_ADAPTER.validate_json(line))
+        except ValidationError:
+            continue
+    return records
+
+
+def _object_lines(lines: Sequence[bytes]) -> list[bytes]:
+    """Stripped lines that could each hold one JSON object (``{...}``).
+
+    Anything else is rejected by parse_line too, so dropping it up front
+    keeps such lines out of the batch.
+    """
+    return [s for line in lines if (s := line.strip())[:1] == b"{" and s[-1:] == b"}"]
+
+
+def _join_array(objects: list[bytes]) -> bytes:
+    """Join per-line JSON objects into one JSON array document."""
+    return b"[" + b",".join(objects) + b"]"
+
+
+def _parse_lines(lines: list[bytes]) -> list[TelemetryEntry]:
+    """Validate byte lines, batch first and per-line on failure.
+
+    The batch result is used only if it holds exactly one entry per line:
+    a line such as ``{...},{...}`` decodes as two array elements but is
+    rejected by parse_line, and the batch must accept the same lines.
+    """
+    objects = _object_lines(lines)
+    try:
+        entries = _ENTRY_LIST_ADAPTER.validate_json(_join_array(objects))
+    except ValidationError:
+        pass
+    else:
+        if len(entries) == len(objects):
+            return entries
+    entries = []
+    for line in objects:
+        entry = parse_line(line)
+        if entry is not None:
+            entries.append(entry)
+    return entries
 
 
 def parse_stream(stream: TextIO) -> list[TelemetryEntry]:
@@ -53,19 +163,43 @@ def filter_entries(
     entries: list[TelemetryEntry],
     type_filter: str | None = None,
     component_filter: str | None = None,
-    message_filter: str | None = None,
+    message_filter: str | Sequence[str] | None = None,
 ) -> list[TelemetryEntry]:
-    """Filter entries by type, component, and/or message substring."""
+    """Filter entries by type, component, and/or message substring.
+
+    ``message_filter`` may be a single substring or several; with several,
+    an entry matches if its message contains any of them.
+    """
     result = entries
-    if type_filter is not None:
+    if type_filter is not None and component_filter is not None:
+        # One pass with both tests inline beats two chained scans.
+        result = [
+            e
+            for e in result
+            if e.type == type_filter and e.component == component_filter
+        ]
+    elif type_filter is not None:
         result = [e for e in result if e.type == type_filter]
-    if component_filter is not None:
+    elif component_filter is not None:
         result = [e for e in result if e.component == component_filter]
-    if message_filter is not None:
+    if isinstance(message_filter, str):
         result = [e for e in result if message_filter in e.message]
+    elif message_filter:
+        search = _compile_message_matcher(tuple(message_filter))
+        result = [e for e in result if search(e.message)]
     return result
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_message_matcher(
+    substrings: tuple[str, ...],
+) -> Callable[[str], re.Match[str] | None]:
+    """Compile substrings into one alternation so each message is scanned once."""
+    # Longest first so a shorter prefix never shadows a longer literal.
+    ordered = sorted(set(substrings), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered))).search
+
+
 def summarize(entries: list[TelemetryEntry]) -> LogSummary:
     """Compute aggregate statistics from a list of telemetry entries."""
     type_counts: Counter[str] = Counter()
@@ -192,38 +326,56 @@ def _detect_error_bursts(
     threshold: int,
     window_sec: float,
 ) -> list[Anomaly]:
-    """Detect bursts of errors within a sliding time window."""
+    """Detect bursts of errors within a sliding time window.
+
+    Overlapping qualifying windows form one burst; each separate burst in
+    the log is reported once, at its first error.
+    """
     errors = [e for e in entries if e.type == "error"]
     if len(errors) < threshold:
         return []
 
-    anomalies: list[Anomaly] = []
-    # Sliding window: for each error, count how many errors fall within window_sec
-    reported = False
-    for i, error in enumerate(errors):
-        window_start = error.timestamp
-        count = 0
-        for j in range(i, len(errors)):
-            delta = (errors[j].timestamp - window_start).total_seconds()
-            if delta <= window_sec:
-                count += 1
-            else:
-                break
-        if count >= threshold and not reported:
-            anomalies.append(
-                Anomaly(
-                    type="error_burst",
-                    severity="critical",
-                    timestamp=error.timestamp,
-                    message=(
-                        f"{count} errors within {window_sec}s"
-                        f" (threshold: {threshold})"
-                    ),
-                    details={"error_count": count, "window_sec": window_sec},
-                )
-            )
-            reported = True
-    return anomalies
+    # Integer microsecond offsets keep window comparisons exact.
+    t0 = errors[0].timestamp
+    offsets_us = [(e.timestamp - t0) // _ONE_MICROSECOND for e in errors]
+    return [
+        Anomaly(
+            type="error_burst",
+            severity="critical",
+            timestamp=errors[start].timestamp,
+            message=f"{count} errors within {window_sec}s (threshold: {threshold})",
+            details={"error_count": count, "window_sec": window_sec},
+        )
+        for start, count in _scan_bursts(offsets_us, window_sec * 1_000_000, threshold)
+    ]
+
+
+def _scan_bursts(
+    offsets: list[int], window: float, threshold: int
+) -> list[tuple[int, int]]:
+    """Find bursts: runs of overlapping windows holding >= ``threshold`` events.
+
+    ``offsets`` must be in non-decreasing (log) order. Two-pointer scan:
+    ``hi`` only moves forward, so the whole pass is O(n). Returns one
+    (start index, events in [offsets[start], offsets[start] + window])
+    pair per burst, where a window starting inside the previous
+    qualifying window extends that burst rather than opening a new one.
+    """
+    bursts: list[tuple[int, int]] = []
+    n = len(offsets)
+    hi = 0
+    burst_end = 0
+    for lo in range(n):
+        limit = offsets[lo] + window
+        if hi < lo:
+            hi = lo
+        while hi < n and offsets[hi] <= limit:
+            hi += 1
+        if hi - lo >= threshold:
+            if lo >= burst_end:
+                bursts.append((lo, hi - lo))
+            burst_end = hi
+    return bursts
 
 
 def _detect_unexpected_disconnects(entries: list[TelemetryEntry]) -> list[Anomaly]:
@@ -338,6 +490,37 @@ def format_game_mechanics(summary: GameMechanicSummary) -> str:
     return "\n".join(lines)
 
 
+def iter_parse_result_json(
+    entries: Sequence[TelemetryEntry],
+    summary: LogSummary,
+    anomalies: Sequence[Anomaly],
+) -> Iterator[str]:
+    """Yield ParseResult(...).model_dump_json(indent=2) in per-entry chunks.
+
+    Concatenating the chunks gives the same text as dumping a ParseResult,
+    but each entry is serialized on its own, so the whole document is
+    never held in memory at once.
+    """
+
+    def _nested(model: BaseModel, depth: int) -> str:
+        return model.model_dump_json(indent=2).replace("\n", "\n" + "  " * depth)
+
+    def _array(key: str, items: Sequence[BaseModel]) -> Iterator[str]:
+        if not items:
+            yield f'  "{key}": []'
+            return
+        yield f'  "{key}": [\n'
+        for i, item in enumerate(items):
+            yield ("    " if i == 0 else ",\n    ") + _nested(item, 2)
+        yield "\n  ]"
+
+    yield "{\n"
+    yield from _array("entries", entries)
+    yield ',\n  "summary": ' + _nested(summary, 1) + ",\n"
+    yield from _array("anomalies", anomalies)
+    yield "\n}"
+
+
 def format_entries(entries: list[TelemetryEntry]) -> str:
     """Format telemetry entries as compact one-line-per-entry output."""
     lines: list[str] = []
@@ -2,17 +2,25 @@
 
 Provides async TCP clients that generate WoW-realistic game traffic
 (movement, spell casts, combat) at configurable rates, plus an
-orchestrator that spawns N concurrent clients.
+orchestrator that spawns N concurrent clients. Session results are
+assembled from values the clients measured themselves, so they are built
+with ``model_construct`` to skip re-validation.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import random
+import socket
 import threading
 import time
+from bisect import bisect
+from collections.abc import Iterator
+from itertools import accumulate
 
+from wowsim.event_loop import fast_loop_factory
 from wowsim.models import ClientConfig, ClientResult, SpawnResult
 
 # ---------------------------------------------------------------------------
@@ -26,77 +34,163 @@ ACTION_WEIGHTS: dict[str, float] = {
 }
 """Probability weights for each action type (must sum to 1.0)."""
 
-SPELL_IDS: list[int] = [100, 101, 102, 103, 200, 201, 300]
+SPELL_IDS: tuple[int, ...] = (100, 101, 102, 103, 200, 201, 300)
 """Available spell IDs matching C++ SpellCastEvent conventions."""
 
-CAST_TIMES: list[int] = [0, 0, 20, 30, 40]
+CAST_TIMES: tuple[int, ...] = (0, 0, 20, 30, 40)
 """Cast time options in ticks (0 = instant, weighted towards instant)."""
 
 # Target IDs for combat actions (NPC convention: >= 1,000,000)
 _DEFAULT_TARGET_ID: int = 1_000_001
 
+_DAMAGE_TYPES: tuple[str, ...] = ("PHYSICAL", "MAGICAL")
+
+SEND_BATCH_SIZE: int = 16
+"""Queued actions that trigger an immediate write + drain."""
+
+SEND_FLUSH_DELAY_SEC: float = 0.005
+"""Longest a queued action waits before being written (latency bound)."""
+
+PACING_TICK_SEC: float = 0.010
+"""Shortest sleep between send bursts in MockGameClient.run."""
+
+STOP_POLL_SEC: float = 0.05
+"""How often run() checks a plain threading.Event stop signal between sends.
+A ThreadStopEvent wakes the loop directly instead."""
+
+
+class ThreadStopEvent(threading.Event):
+    """threading.Event that also wakes event loops waiting on it.
+
+    set() schedules ``asyncio.Event.set`` on every loop currently inside
+    watch() via call_soon_threadsafe, so a loop running in a worker thread
+    stops as soon as another thread (e.g. the dashboard UI) sets the event.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._watchers_lock = threading.Lock()
+        self._watchers: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def set(self) -> None:
+        with self._watchers_lock:
+            super().set()
+            watchers = list(self._watchers)
+        for loop, async_event in watchers:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(async_event.set)
+
+    @contextlib.contextmanager
+    def watch(self) -> Iterator[asyncio.Event]:
+        """Mirror this event into an asyncio.Event on the running loop."""
+        watcher = (asyncio.get_running_loop(), asyncio.Event())
+        with self._watchers_lock:
+            self._watchers.append(watcher)
+            if self.is_set():
+                watcher[1].set()
+        try:
+            yield watcher[1]
+        finally:
+            with self._watchers_lock:
+                self._watchers.remove(watcher)
+
+
+StopEvent = threading.Event | asyncio.Event
+"""Stop signal accepted by run/spawn_clients (asyncio or thread-safe)."""
+
 
 # ---------------------------------------------------------------------------
 # Traffic generation (pure functions, no I/O)
 # ---------------------------------------------------------------------------
 
+# Bound methods of the module-level Random instance: one global lookup per
+# call instead of a module global plus an attribute load. random.seed()
+# still applies, since it reseeds the same instance.
+_rand = random.random
+_randint = random.randint
+
+# Sequence sizes for uniform picks as seq[int(_rand() * n)], which skips
+# random.choice's len() call and Python-level _randbelow loop.
+_N_SPELLS: int = len(SPELL_IDS)
+_N_CAST_TIMES: int = len(CAST_TIMES)
+_N_DAMAGE_TYPES: int = len(_DAMAGE_TYPES)
 
-def generate_movement_action(client_id: int, x: float, y: float, z: float) -> dict:
+
+def generate_movement_action(
+    client_id: int, x: float, y: float, z: float, rng: random.Random | None = None
+) -> dict:
     """Generate a movement event payload with small random delta.
 
-    Position offsets: ±5 for x/y, ±0.5 for z.
+    Position offsets: ±5 for x/y, ±0.5 for z. Draws from ``rng`` when
+    given, else the module-level generator (as do the other generators).
     """
+    rand = _rand if rng is None else rng.random
+    # Inlined random.uniform(a, b) == a + (b - a) * random(): same values,
+    # one C call each instead of a Python-level wrapper per coordinate.
     return {
         "type": "movement",
         "session_id": client_id,
         "position": {
-            "x": x + random.uniform(-5.0, 5.0),
-            "y": y + random.uniform(-5.0, 5.0),
-            "z": z + random.uniform(-0.5, 0.5),
+            "x": x + (-5.0 + 10.0 * rand()),
+            "y": y + (-5.0 + 10.0 * rand()),
+            "z": z + (-0.5 + 1.0 * rand()),
         },
     }
 
 
-def generate_spell_cast_action(client_id: int) -> dict:
+def generate_spell_cast_action(
+    client_id: int, rng: random.Random | None = None
+) -> dict:
     """Generate a spell cast event with random spell and cast time."""
+    rand = _rand if rng is None else rng.random
     return {
         "type": "spell_cast",
         "session_id": client_id,
         "action": "CAST_START",
-        "spell_id": random.choice(SPELL_IDS),
-        "cast_time_ticks": random.choice(CAST_TIMES),
+        "spell_id": SPELL_IDS[int(rand() * _N_SPELLS)],
+        "cast_time_ticks": CAST_TIMES[int(rand() * _N_CAST_TIMES)],
     }
 
 
-def generate_combat_action(client_id: int, target_id: int) -> dict:
+def generate_combat_action(
+    client_id: int, target_id: int, rng: random.Random | None = None
+) -> dict:
     """Generate a combat attack event with random damage."""
+    rand, randint = (_rand, _randint) if rng is None else (rng.random, rng.randint)
     return {
         "type": "combat",
         "session_id": client_id,
         "action": "ATTACK",
         "target_session_id": target_id,
-        "base_damage": random.randint(10, 50),
-        "damage_type": random.choice(["PHYSICAL", "MAGICAL"]),
+        "base_damage": randint(10, 50),
+        "damage_type": _DAMAGE_TYPES[int(rand() * _N_DAMAGE_TYPES)],
     }
 
 
-def choose_action(client_id: int, x: float, y: float, z: float) -> dict:
+_ACTION_TYPES: tuple[str, ...] = tuple(ACTION_WEIGHTS)
+_CUM_WEIGHTS: tuple[float, ...] = tuple(accumulate(ACTION_WEIGHTS.values()))
+_TOTAL_WEIGHT: float = _CUM_WEIGHTS[-1]
+
+
+def choose_action(
+    client_id: int, x: float, y: float, z: float, rng: random.Random | None = None
+) -> dict:
     """Select a random action using weighted distribution.
 
-    Returns a dict payload matching C++ event types.
+    Returns a dict payload matching C++ event types. The type is drawn by
+    bisecting the precomputed cumulative weights, which is what
+    random.choices does internally, minus rebuilding the weight lists and
+    the result list on every call.
     """
-    action_type = random.choices(
-        list(ACTION_WEIGHTS.keys()),
-        weights=list(ACTION_WEIGHTS.values()),
-        k=1,
-    )[0]
+    rand = _rand if rng is None else rng.random
+    action_type = _ACTION_TYPES[bisect(_CUM_WEIGHTS, rand() * _TOTAL_WEIGHT)]
 
     if action_type == "movement":
-        return generate_movement_action(client_id, x, y, z)
+        return generate_movement_action(client_id, x, y, z, rng)
     elif action_type == "spell_cast":
-        return generate_spell_cast_action(client_id)
+        return generate_spell_cast_action(client_id, rng)
     else:
-        return generate_combat_action(client_id, _DEFAULT_TARGET_ID)
+        return generate_combat_action(client_id, _DEFAULT_TARGET_ID, rng)
 
 
 # ---------------------------------------------------------------------------
@@ -113,7 +207,9 @@ class MockGameClient:
             result = await c.run(config)
     """
 
-    def __init__(self, client_id: int, host: str, port: int) -> None:
+    def __init__(
+        self, client_id: int, host: str, port: int, seed: int | None = None
+    ) -> None:
         self._client_id = client_id
         self._host = host
         self._port = port
@@ -123,6 +219,10 @@ class MockGameClient:
         self._y: float = 0.0
         self._z: float = 0.0
         self._actions_sent: int = 0
+        self._pending: list[bytes] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Per-client generator (OS-seeded unless ``seed`` is given).
+        self._rng = random.Random(seed)
 
     @property
     def connected(self) -> bool:
@@ -141,8 +241,9 @@ class MockGameClient:
         )
 
     async def close(self) -> None:
-        """Close the TCP connection."""
+        """Close the TCP connection, writing any queued actions first."""
         if self._writer is not None:
+            self._write_pending()
             self._writer.close()
             await self._writer.wait_closed()
             self._writer = None
@@ -155,51 +256,123 @@ class MockGameClient:
     async def __aexit__(self, *exc: object) -> None:
         await self.close()
 
-    async def send_action(self) -> None:
-        """Generate and send a single random action to the server."""
-        if self._writer is None:
-            return
-        action = choose_action(self._client_id, self._x, self._y, self._z)
-        # Update position tracking for movement actions
+    def _generate_payload(self) -> bytes:
+        """Draw a random action as newline-terminated JSON bytes.
+
+        Movement actions update the tracked position.
+        """
+        action = choose_action(self._client_id, self._x, self._y, self._z, self._rng)
         if action["type"] == "movement":
             self._x = action["position"]["x"]
             self._y = action["position"]["y"]
             self._z = action["position"]["z"]
-        payload = json.dumps(action) + "\n"
-        self._writer.write(payload.encode())
-        await self._writer.drain()
+        return (json.dumps(action) + "\n").encode()
+
+    async def send_action(self) -> None:
+        """Generate and queue a single random action for the server.
+
+        Actions are written in batches: a full batch of SEND_BATCH_SIZE is
+        written with one writelines() and one drain(); a partial batch is
+        written by a timer within SEND_FLUSH_DELAY_SEC.
+        """
+        if self._writer is None:
+            return
+        self.send_action_nowait()
+        if len(self._pending) >= SEND_BATCH_SIZE:
+            self._write_pending()
+            await self._writer.drain()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                SEND_FLUSH_DELAY_SEC, self._write_pending
+            )
+
+    def send_action_nowait(self) -> None:
+        """Queue a single random action without writing or scheduling a flush.
+
+        The caller is responsible for calling flush(); run() does so once
+        per pacing tick.
+        """
+        if self._writer is None:
+            return
+        self._pending.append(self._generate_payload())
         self._actions_sent += 1
 
+    async def flush(self) -> None:
+        """Write all queued actions and drain the transport once."""
+        if self._writer is None:
+            return
+        self._write_pending()
+        await self._writer.drain()
+
+    def _write_pending(self) -> None:
+        """Hand all queued actions to the transport in one writelines()."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending and self._writer is not None:
+            self._writer.writelines(self._pending)
+            self._pending.clear()
+
     async def run(
         self,
         config: ClientConfig,
-        stop_event: threading.Event | None = None,
+        stop_event: StopEvent | None = None,
+        connect_slots: asyncio.Semaphore | None = None,
     ) -> ClientResult:
         """Run the client loop for the configured duration.
 
         Connects (if not already connected), sends actions at the
         configured rate, then disconnects. Returns a ClientResult.
+        Pacing is a token bucket: each wakeup sends every action that has
+        come due and drains once, sleeping at least PACING_TICK_SEC, so
+        high rates cost one timer per tick rather than one per action.
 
         Args:
             config: Client configuration (host, port, rate, duration).
-            stop_event: Optional threading.Event checked each iteration;
-                when set, the loop exits early for graceful shutdown.
+            stop_event: Optional asyncio.Event or threading.Event; when
+                set, the loop exits early for graceful shutdown. An
+                asyncio.Event or ThreadStopEvent wakes the loop at once; a
+                plain threading.Event is checked every STOP_POLL_SEC.
+            connect_slots: Optional semaphore held only while dialing, to
+                bound how many clients connect at once.
         """
+        if isinstance(stop_event, ThreadStopEvent):
+            with stop_event.watch() as async_stop:
+                return await self.run(config, async_stop, connect_slots)
         start = time.monotonic()
         try:
             if not self.connected:
-                await self.connect()
-            interval = 1.0 / config.actions_per_second
+                async with connect_slots or contextlib.nullcontext():
+                    await self.connect()
+            rate = config.actions_per_second
             deadline = start + config.duration_seconds
-            while time.monotonic() < deadline:
+            # Pace from when the connection is up, so time spent waiting for
+            # a connect slot isn't sent as one burst of backlog.
+            paced_from = time.monotonic()
+            sent = 0
+            while (now := time.monotonic()) < deadline:
                 if stop_event is not None and stop_event.is_set():
                     break
-                await self.send_action()
-                remaining = deadline - time.monotonic()
-                if remaining > 0:
-                    await asyncio.sleep(min(interval, remaining))
+                # Token bucket: send every action that has come due since
+                # the last tick back-to-back, then drain once.
+                due = int((now - paced_from) * rate) + 1
+                while sent < due:
+                    self.send_action_nowait()
+                    sent += 1
+                await self.flush()
+                next_due = min(paced_from + sent / rate, deadline)
+                delay = max(PACING_TICK_SEC, next_due - now)
+                if stop_event is None:
+                    await asyncio.sleep(delay)
+                elif isinstance(stop_event, threading.Event):
+                    await asyncio.sleep(min(delay, STOP_POLL_SEC))
+                else:
+                    # Sleep on the event itself so a stop wakes us at once.
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(delay):
+                            await stop_event.wait()
         except OSError as exc:
-            return ClientResult(
+            return ClientResult.model_construct(
                 client_id=self._client_id,
                 connected=False,
                 actions_sent=self._actions_sent,
@@ -209,7 +382,7 @@ class MockGameClient:
         finally:
             await self.close()
 
-        return ClientResult(
+        return ClientResult.model_construct(
             client_id=self._client_id,
             connected=True,
             actions_sent=self._actions_sent,
@@ -222,17 +395,46 @@ class MockGameClient:
 # ---------------------------------------------------------------------------
 
 
+async def _resolve_host(host: str, port: int) -> str:
+    """Resolve ``host`` to its numeric address when it has exactly one.
+
+    Dialing a numeric address lets asyncio skip getaddrinfo, so spawning N
+    clients costs one lookup instead of N. Hosts with several addresses
+    (e.g. localhost as ::1 and 127.0.0.1) are returned unchanged so each
+    connect() keeps falling back across them, and a failed lookup is left
+    for each client's own connect() to report.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError:
+        return host
+    addresses = {info[4][0] for info in infos}
+    return addresses.pop() if len(addresses) == 1 else host
+
+
 async def _run_one(
     client_id: int,
     config: ClientConfig,
-    stop_event: threading.Event | None = None,
+    stop_event: StopEvent | None = None,
+    connect_slots: asyncio.Semaphore | None = None,
+    host: str | None = None,
 ) -> ClientResult:
-    """Run a single mock client, capturing all failures."""
-    client = MockGameClient(client_id=client_id, host=config.host, port=config.port)
+    """Run a single mock client, capturing all failures.
+
+    ``host`` overrides ``config.host`` for dialing (e.g. a pre-resolved
+    address).
+    """
+    seed = None if config.seed is None else config.seed + client_id
+    client = MockGameClient(
+        client_id=client_id, host=host or config.host, port=config.port, seed=seed
+    )
     try:
-        return await client.run(config, stop_event=stop_event)
+        return await client.run(
+            config, stop_event=stop_event, connect_slots=connect_slots
+        )
     except Exception as exc:
-        return ClientResult(
+        return ClientResult.model_construct(
             client_id=client_id,
             connected=False,
             actions_sent=0,
@@ -244,29 +446,49 @@ async def _run_one(
 async def spawn_clients(
     config: ClientConfig,
     count: int,
-    stop_event: threading.Event | None = None,
+    stop_event: StopEvent | None = None,
 ) -> SpawnResult:
     """Spawn N concurrent mock clients and collect results.
 
-    Each client runs independently via asyncio.gather, connecting to
-    the server specified in config and generating traffic for the
-    configured duration.
+    Each client runs as its own task in an asyncio.TaskGroup, connecting
+    to the server specified in config and generating traffic for the
+    configured duration. At most ``config.max_concurrent_connects``
+    clients dial up at once, so large spawns don't overflow the server's
+    accept queue.
 
     Args:
         config: Client configuration.
         count: Number of clients to spawn.
-        stop_event: Optional threading.Event; when set, all clients
-            exit their loops early for graceful shutdown.
+        stop_event: Optional asyncio.Event or threading.Event; when set,
+            all clients exit their loops early for graceful shutdown. A
+            ThreadStopEvent is watched once here and shared by all clients.
     """
+    if isinstance(stop_event, ThreadStopEvent):
+        with stop_event.watch() as async_stop:
+            return await spawn_clients(config, count, async_stop)
     start = time.monotonic()
-    tasks = [_run_one(i, config, stop_event=stop_event) for i in range(count)]
-    results = await asyncio.gather(*tasks)
+    connect_slots = asyncio.Semaphore(max(1, config.max_concurrent_connects))
+    host = await _resolve_host(config.host, config.port)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                _run_one(
+                    i,
+                    config,
+                    stop_event=stop_event,
+                    connect_slots=connect_slots,
+                    host=host,
+                )
+            )
+            for i in range(count)
+        ]
+    results = [t.result() for t in tasks]
     elapsed = time.monotonic() - start
 
     successful = sum(1 for r in results if r.connected)
     total_actions = sum(r.actions_sent for r in results)
 
-    return SpawnResult(
+    return SpawnResult.model_construct(
         total_clients=count,
         successful_connections=successful,
         failed_connections=count - successful,
@@ -281,8 +503,12 @@ def run_spawn(
     count: int,
     stop_event: threading.Event | None = None,
 ) -> SpawnResult:
-    """Synchronous wrapper around spawn_clients for CLI use."""
-    return asyncio.run(spawn_clients(config, count, stop_event=stop_event))
+    """Synchronous wrapper around spawn_clients for CLI use.
+
+    Runs on uvloop when the ``fast`` extra is installed.
+    """
+    with asyncio.Runner(loop_factory=fast_loop_factory()) as runner:
+        return runner.run(spawn_clients(config, count, stop_event=stop_event))
 
 
 # ---------------------------------------------------------------------------
@@ -290,29 +516,28 @@ def run_spawn(
 # ---------------------------------------------------------------------------
 
 
+_SPAWN_RESULT_HEADER = "=== Mock Client Spawn Results ==="
+
+
 def format_spawn_result(result: SpawnResult) -> str:
     """Format spawn results as a human-readable table.
 
     Includes summary header and per-client status lines.
     """
-    lines: list[str] = []
-    lines.append("=== Mock Client Spawn Results ===")
-    lines.append(
+    lines = [
+        _SPAWN_RESULT_HEADER,
         f"Clients:     {result.total_clients} total, "
         f"{result.successful_connections} connected, "
-        f"{result.failed_connections} failed"
+        f"{result.failed_connections} failed",
+        f"Actions:     {result.total_actions_sent} total",
+        f"Duration:    {result.total_duration_seconds:.2f}s",
+        "",
+        "Per-client:",
+    ]
+    lines.extend(
+        f"  Client {c.client_id:<5d} {'connected' if c.connected else 'FAILED':<12s}"
+        f" {c.actions_sent:>4d} actions  {c.duration_seconds:.2f}s"
+        + (f"  ({c.error})" if c.error else "")
+        for c in result.clients
     )
-    lines.append(f"Actions:     {result.total_actions_sent} total")
-    lines.append(f"Duration:    {result.total_duration_seconds:.2f}s")
-    lines.append("")
-    lines.append("Per-client:")
-    for c in result.clients:
-        status = "connected" if c.connected else "FAILED"
-        line = (
-            f"  Client {c.client_id:<5d} {status:<12s}"
-            f" {c.actions_sent:>4d} actions  {c.duration_seconds:.2f}s"
-        )
-        if c.error:
-            line += f"  ({c.error})"
-        lines.append(line)
     return "\n".join(lines)
@@ -2,23 +2,76 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, NotRequired
 
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field
+from typing_extensions import TypedDict  # pydantic rejects typing's before 3.12
+
+# Read-mostly value models are built in bulk (telemetry replay, health and
+# game-metric aggregation) and never mutated after construction.
+_VALUE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+"""String drawn from a small closed set (IDs, commands); interned on
+validation so repeated values share one object and compare by identity."""
+
+
+def _parse_iso_datetime(value: Any) -> Any:
+    """Parse ISO-8601 strings with the stdlib C parser; defer anything else."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass  # Let pydantic-core parse it or report the error.
+    return value
+
+
+IsoDatetime = Annotated[datetime, BeforeValidator(_parse_iso_datetime)]
+"""Telemetry timestamp. 'Z' values get the stdlib ``timezone.utc`` rather
+than pydantic-core's ``TzInfo``, which is several times slower to compare,
+sort, and convert with ``.timestamp()`` in the aggregators."""
+
+ControlCommand = Literal["activate", "deactivate", "deactivate_all", "status", "list"]
+"""Commands understood by the C++ control channel."""
+
+FaultMode = Literal["tick_scoped", "ambient"]
+"""Fault execution mode (mirrors C++ FaultMode)."""
+
+ZoneState = Literal["ACTIVE", "DEGRADED", "CRASHED"]
+"""Zone runtime state (mirrors C++ ZoneState). Literal validation yields the
+shared constant string objects, so states compare by identity."""
 
 
 class TelemetryEntry(BaseModel):
     """A single telemetry log entry from the C++ server."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     v: int
-    timestamp: datetime
+    timestamp: IsoDatetime
     type: Literal["metric", "event", "health", "error"]
     component: str
     message: str
     data: dict[str, Any] = {}
 
 
+class TelemetryRecord(TypedDict):
+    """Validated TelemetryEntry fields as a plain dict.
+
+    Same schema as TelemetryEntry, for bulk columnar decoding where
+    building a model instance per line is unnecessary.
+    """
+
+    v: int
+    timestamp: IsoDatetime
+    type: Literal["metric", "event", "health", "error"]
+    component: str
+    message: str
+    data: NotRequired[dict[str, Any]]
+
+
 class LogSummary(BaseModel):
     """Aggregate statistics from a telemetry log."""
 
@@ -58,8 +111,8 @@ class FaultActivateRequest(BaseModel):
     """Request to activate a fault via the control channel."""
 
     command: Literal["activate"] = "activate"
-    fault_id: str
-    params: dict[str, Any] = {}
+    fault_id: InternedStr
+    params: dict[str, Any] = Field(default_factory=dict)
     target_zone_id: int = 0
     duration_ticks: int = 0
 
@@ -68,7 +121,7 @@ class FaultDeactivateRequest(BaseModel):
     """Request to deactivate a specific fault."""
 
     command: Literal["deactivate"] = "deactivate"
-    fault_id: str
+    fault_id: InternedStr
 
 
 class FaultDeactivateAllRequest(BaseModel):
@@ -81,7 +134,7 @@ class FaultStatusRequest(BaseModel):
     """Request for the status of a specific fault."""
 
     command: Literal["status"] = "status"
-    fault_id: str
+    fault_id: InternedStr
 
 
 class FaultListRequest(BaseModel):
@@ -93,8 +146,10 @@ class FaultListRequest(BaseModel):
 class FaultInfo(BaseModel):
     """Status of a single fault, as returned by the server."""
 
-    id: str
-    mode: str
+    model_config = _VALUE_MODEL_CONFIG
+
+    id: InternedStr
+    mode: FaultMode
     active: bool
     activations: int = 0
     ticks_elapsed: int = 0
@@ -105,8 +160,8 @@ class ControlResponse(BaseModel):
     """Generic control channel response (covers all command types)."""
 
     success: bool
-    command: str | None = None
-    fault_id: str | None = None
+    command: ControlCommand | None = None
+    fault_id: InternedStr | None = None
     error: str | None = None
     status: FaultInfo | None = None
     faults: list[FaultInfo] | None = None
@@ -120,6 +175,8 @@ class ControlResponse(BaseModel):
 class TickHealth(BaseModel):
     """Tick rate stability metrics from recent telemetry."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     total_ticks: int
     avg_duration_ms: float
     max_duration_ms: float
@@ -131,8 +188,10 @@ class TickHealth(BaseModel):
 class ZoneHealthSummary(BaseModel):
     """Per-zone health from recent telemetry."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     zone_id: int
-    state: str
+    state: ZoneState
     tick_count: int
     error_count: int
     avg_tick_duration_ms: float
@@ -144,6 +203,8 @@ class ZoneHealthSummary(BaseModel):
 class HealthReport(BaseModel):
     """Complete server health report."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     timestamp: datetime
     status: Literal["healthy", "degraded", "critical"]
     server_reachable: bool
@@ -165,6 +226,8 @@ class HealthReport(BaseModel):
 class CastMetrics(BaseModel):
     """Aggregate spell-casting statistics from telemetry."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     casts_started: int
     casts_completed: int
     casts_interrupted: int
@@ -177,6 +240,8 @@ class CastMetrics(BaseModel):
 class EntityDPS(BaseModel):
     """Per-entity damage output statistics."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     entity_id: int
     total_damage: int
     dps: float
@@ -186,6 +251,8 @@ class EntityDPS(BaseModel):
 class CombatMetrics(BaseModel):
     """Aggregate combat statistics from telemetry."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     total_damage: int
     total_attacks: int
     kills: int
@@ -214,6 +281,8 @@ class ClientConfig(BaseModel):
     port: int = 8080
     actions_per_second: float = 2.0
     duration_seconds: float = 10.0
+    max_concurrent_connects: int = 256
+    seed: int | None = None
 
 
 class ClientResult(BaseModel):
@@ -245,6 +314,8 @@ class SpawnResult(BaseModel):
 class PipelineConfig(BaseModel):
     """Configuration for a hotfix deployment pipeline run."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     version: str = "1.0.0"
     fault_id: str
     action: Literal["activate", "deactivate"]
@@ -264,6 +335,8 @@ class PipelineConfig(BaseModel):
 class StageResult(BaseModel):
     """Outcome of a single pipeline stage."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     stage: Literal["build", "validate", "canary", "promote", "rollback"]
     passed: bool
     message: str
@@ -275,6 +348,8 @@ class StageResult(BaseModel):
 class PipelineResult(BaseModel):
     """Complete result from a pipeline run."""
 
+    model_config = _VALUE_MODEL_CONFIG
+
     config: PipelineConfig
     stages: list[StageResult]
     outcome: Literal["promoted", "rolled_back", "aborted"]
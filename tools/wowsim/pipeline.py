@@ -7,6 +7,7 @@ into a multi-stage pipeline with automated health gates and rollback.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from pathlib import Path
 
@@ -22,6 +23,8 @@ from wowsim.models import (
 # Pure gate functions (no I/O, fully testable)
 # ---------------------------------------------------------------------------
 
+_SEVERITY: dict[str, int] = {"healthy": 0, "degraded": 1, "critical": 2}
+
 
 def check_build_preconditions(reachable: bool, status: str) -> StageResult:
     """Build stage gate: server must be reachable and not critical.
@@ -74,12 +77,12 @@ def evaluate_canary_health(
 
     Returns (passed, message). Fails on first sample at or above threshold.
     """
-    severity_order = {"healthy": 0, "degraded": 1, "critical": 2}
-    threshold_level = severity_order.get(threshold, 2)
+    threshold_level = _SEVERITY.get(threshold, 2)
+    # Unknown statuses rank as critical, so only listed ones can pass.
+    passing = {s for s, level in _SEVERITY.items() if level < threshold_level}
 
     for i, sample in enumerate(samples):
-        sample_level = severity_order.get(sample, 2)
-        if sample_level >= threshold_level:
+        if sample not in passing:
             return (
                 False,
                 f"Canary failed: sample {i + 1}/{len(samples)} "
@@ -189,15 +192,28 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
 
     Stages: build → validate → canary → promote/rollback.
     Returns a PipelineResult with all stages and final outcome.
+    Synchronous wrapper around run_pipeline_async.
+    """
+    return asyncio.run(run_pipeline_async(config))
+
+
+async def run_pipeline_async(config: PipelineConfig) -> PipelineResult:
+    """Run the hotfix deployment pipeline on the running event loop.
+
+    Health checks and fault commands are blocking, so each runs in a worker
+    thread; canary polling waits with asyncio.sleep, letting other
+    pipelines or I/O progress on the same loop between samples.
     """
     pipeline_start = time.monotonic()
     stages: list[StageResult] = []
 
     # --- BUILD ---
     t0 = time.monotonic()
-    report = _get_health_report(config)
+    report = await asyncio.to_thread(_get_health_report, config)
     build_result = check_build_preconditions(report.server_reachable, report.status)
-    build_result.duration_seconds = time.monotonic() - t0
+    build_result = build_result.model_copy(
+        update={"duration_seconds": time.monotonic() - t0}
+    )
     stages.append(build_result)
 
     if not build_result.passed:
@@ -210,9 +226,11 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
 
     # --- VALIDATE ---
     t0 = time.monotonic()
-    report = _get_health_report(config)
+    report = await asyncio.to_thread(_get_health_report, config)
     validate_result = check_validate_gate(report)
-    validate_result.duration_seconds = time.monotonic() - t0
+    validate_result = validate_result.model_copy(
+        update={"duration_seconds": time.monotonic() - t0}
+    )
     stages.append(validate_result)
 
     if not validate_result.passed:
@@ -225,15 +243,16 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
 
     # --- CANARY ---
     t0 = time.monotonic()
-    _execute_deploy_action(config)
+    await asyncio.to_thread(_execute_deploy_action, config)
 
     samples: list[str] = []
     deadline = time.monotonic() + config.canary_duration_seconds
     while time.monotonic() < deadline:
-        time.sleep(config.canary_poll_interval_seconds)
-        canary_report = _get_health_report(config)
+        await asyncio.sleep(config.canary_poll_interval_seconds)
+        canary_report = await asyncio.to_thread(_get_health_report, config)
         samples.append(canary_report.status)
-        passed, message = evaluate_canary_health(samples, config.rollback_on)
+        # Earlier samples already passed; only the new one can fail.
+        passed, _ = evaluate_canary_health(samples[-1:], config.rollback_on)
         if not passed:
             break
 
@@ -251,7 +270,7 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
     if not canary_passed:
         # --- ROLLBACK ---
         t0 = time.monotonic()
-        _execute_rollback(config)
+        await asyncio.to_thread(_execute_rollback, config)
         rollback_result = StageResult(
             stage="rollback",
             passed=True,
@@ -0,0 +1,101 @@
+"""Columnar (struct-of-arrays) views over parsed telemetry.
+
+Aggregators only read a handful of numeric fields out of each entry's
+``data`` dict. Extracting those fields once into flat columns lets every
+downstream computation reduce over plain lists instead of repeating the
+per-entry filter and dict lookups.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from wowsim.models import TelemetryEntry, TelemetryRecord
+
+
+@dataclass(slots=True)
+class TelemetryColumns:
+    """Numeric telemetry columns consumed by health and game-metric aggregators.
+
+    Tick columns come from game_loop 'Tick completed' metrics; damage
+    columns come from combat 'Damage dealt' events. Parallel lists share
+    an index (``tick_durations[i]`` pairs with ``tick_overruns[i]``);
+    ``damage_attackers`` is the running set of distinct attacker IDs.
+    """
+
+    tick_durations: list[float] = field(default_factory=list)
+    tick_overruns: list[bool] = field(default_factory=list)
+    damage_attacker_ids: list[int] = field(default_factory=list)
+    damage_amounts: list[int] = field(default_factory=list)
+    damage_attackers: set[int] = field(default_factory=set)
+    kills: int = 0
+    duration_seconds: float = 0.0
+
+    @classmethod
+    def from_entries(cls, entries: list[TelemetryEntry]) -> TelemetryColumns:
+        """Build all columns from a list of entries."""
+        durations, overruns = extract_tick_columns(entries)
+        cols = cls(tick_durations=durations, tick_overruns=overruns)
+
+        for e in entries:
+            if e.component != "combat":
+                continue
+            if e.message == "Damage dealt":
+                attacker_id = e.data.get("attacker_id", 0)
+                cols.damage_attacker_ids.append(attacker_id)
+                cols.damage_attackers.add(attacker_id)
+                cols.damage_amounts.append(e.data.get("actual_damage", 0))
+            elif e.message == "Entity killed":
+                cols.kills += 1
+
+        if len(entries) >= 2:
+            timestamps = [e.timestamp for e in entries]
+            cols.duration_seconds = (max(timestamps) - min(timestamps)).total_seconds()
+        return cols
+
+    @classmethod
+    def from_records(cls, records: list[TelemetryRecord]) -> TelemetryColumns:
+        """Build all columns from validated raw records (no model instances)."""
+        cols = cls()
+        for r in records:
+            component = r["component"]
+            if component == "game_loop":
+                if r["type"] == "metric" and r["message"] == "Tick completed":
+                    data = r.get("data", {})
+                    cols.tick_durations.append(data.get("duration_ms", 0.0))
+                    cols.tick_overruns.append(bool(data.get("overrun", False)))
+            elif component == "combat":
+                message = r["message"]
+                if message == "Damage dealt":
+                    data = r.get("data", {})
+                    attacker_id = data.get("attacker_id", 0)
+                    cols.damage_attacker_ids.append(attacker_id)
+                    cols.damage_attackers.add(attacker_id)
+                    cols.damage_amounts.append(data.get("actual_damage", 0))
+                elif message == "Entity killed":
+                    cols.kills += 1
+
+        if len(records) >= 2:
+            timestamps = [r["timestamp"] for r in records]
+            cols.duration_seconds = (max(timestamps) - min(timestamps)).total_seconds()
+        return cols
+
+
+def extract_tick_columns(
+    entries: list[TelemetryEntry],
+) -> tuple[list[float], list[bool]]:
+    """Extract (duration_ms, overrun) columns from game_loop tick metrics.
+
+    Each column is produced by one comprehension, so callers that only need
+    tick stats avoid building the full TelemetryColumns view.
+    """
+    tick_data = [
+        e.data
+        for e in entries
+        if e.component == "game_loop"
+        and e.type == "metric"
+        and e.message == "Tick completed"
+    ]
+    durations = [d.get("duration_ms", 0.0) for d in tick_data]
+    overruns = [bool(d.get("overrun", False)) for d in tick_data]
+    return durations, overruns